@@ -0,0 +1,90 @@
+'''
+solve many inputs of one day in parallel and stream the answers as json lines
+
+usage: python -m aoc.batch DAY INPUT [INPUT ...] [--script FILE] [-j WORKERS] [--chunksize N]
+
+every INPUT is a file, a directory (all files in it) or a glob pattern
+'''
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from glob import glob
+from time import perf_counter
+from types import ModuleType
+from typing import Any
+
+from aoc.solvers import default_script, load_script
+
+type Result = dict[str, Any]
+
+solver: ModuleType | None = None  # one per worker process
+
+
+def init_worker(script: str) -> None:
+    # import once per process, not once per input
+    global solver
+    solver = load_script(script)
+
+
+def solve_file(path: str) -> Result:
+    assert (solver is not None)
+    result: Result = {"input": path}
+    start = perf_counter()
+    try:
+        with open(path) as f:
+            data = f.read()
+        result["part1"], result["part2"] = solver.solve(data)
+    except Exception as e:  # one broken input must not stop the batch
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["time"] = perf_counter() - start
+    return result
+
+
+def collect_inputs(patterns: list[str]) -> list[str]:
+    paths: list[str] = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.extend(sorted(
+                os.path.join(pattern, name) for name in os.listdir(pattern)
+                if os.path.isfile(os.path.join(pattern, name))
+            ))
+        elif os.path.isfile(pattern):
+            paths.append(pattern)
+        else:
+            paths.extend(sorted(glob(pattern, recursive=True)))
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="solve many puzzle inputs of one day in parallel")
+    parser.add_argument("day", type=int)
+    parser.add_argument("inputs", nargs="+", help="input files, directories or glob patterns")
+    parser.add_argument("--script", help="solver relative to the repo root, e.g. day16/p1.py")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--chunksize", type=int, help="inputs per task sent to a worker")
+    args = parser.parse_args()
+
+    script = args.script or default_script(args.day)
+    paths = collect_inputs(args.inputs)
+    if not paths:
+        parser.error("no input files found")
+    workers = min(args.workers, len(paths))
+    # a few chunks per worker: low ipc overhead but still balanced when inputs differ in cost
+    chunksize = args.chunksize or max(1, len(paths) // (workers * 4))
+
+    errors = 0
+    start = perf_counter()
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(script,)) as pool:
+        for result in pool.map(solve_file, paths, chunksize=chunksize):
+            errors += "error" in result
+            print(json.dumps(result, default=str), flush=True)
+    elapsed = perf_counter() - start
+
+    print(f"{script}: {len(paths)} inputs ({errors} failed) in {elapsed:.3f}s "
+          f"with {workers} workers -> {len(paths) / elapsed:.1f} inputs/s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+'''
+time every solver script in a fresh interpreter and write the results as json
+
+usage: python -m aoc.bench [days ...] [--warmup N] [--repeat N] [--timeout S] [-o FILE]
+'''
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from time import perf_counter, sleep
+from typing import Any, Callable
+
+from aoc.solvers import day_of, find_scripts, input_path, module_name, root_path
+
+type Sample = tuple[float, float, int, int]  # (wall_seconds,cpu_seconds,peak_rss_bytes,returncode)
+type Result = dict[str, Any]
+
+
+def run_once(script: str, timeout: float) -> tuple[Sample, str, bool]:
+    # os.wait4 gives us the resource usage of exactly this child,
+    # getrusage(RUSAGE_CHILDREN) would mix up the peak rss of all runs.
+    # polled like Popen.wait(timeout): the child is only killed while it is not reaped yet,
+    # so the signal can never hit a reused pid
+    env = os.environ | {"MPLBACKEND": "Agg"}  # plt.show() must not block
+    with tempfile.TemporaryFile() as err:
+        start = perf_counter()
+        proc = subprocess.Popen([sys.executable, "-m", module_name(script)], cwd=root_path, env=env,
+                                stdout=subprocess.DEVNULL, stderr=err)
+        deadline = start + timeout
+        delay = 0.0005
+        timed_out = False
+        while True:
+            pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+            if pid:
+                break
+            now = perf_counter()
+            if now >= deadline:
+                proc.kill()
+                timed_out = True
+                _, status, usage = os.wait4(proc.pid, 0)
+                break
+            sleep(min(delay, deadline - now))
+            delay = min(2*delay, 0.01)
+        wall = perf_counter() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+
+        err.seek(0)
+        stderr = err.read().decode(errors="replace")
+
+    cpu = usage.ru_utime + usage.ru_stime
+    rss = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)  # linux reports KiB
+    return (wall, cpu, rss, proc.returncode), stderr, timed_out
+
+
+def best_of(f: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    # in-process timing for the benchmarks: best of repeat calls and the result of the last one
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        res = f()
+        best = min(best, perf_counter() - start)
+    return best, res
+
+
+def summary(values: list[float]) -> dict[str, float]:
+    return {
+        "min": min(values),
+        "median": statistics.median(values),
+        "mean": statistics.fmean(values),
+        "max": max(values),
+        "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+    }
+
+
+def bench_script(script: str, warmup: int, repeat: int, timeout: float) -> Result:
+    result: Result = {"script": script, "day": day_of(script)}
+    if not os.path.exists(input_path(script)):
+        result["status"] = "no input"
+        return result
+
+    samples: list[Sample] = []
+    for i in range(warmup + repeat):
+        sample, stderr, timed_out = run_once(script, timeout)
+        returncode = sample[3]
+        if returncode != 0:
+            # no point in repeating a broken or timed out script, a kill from elsewhere (oom) is an error
+            result["status"] = "timeout" if timed_out else "error"
+            result["returncode"] = returncode
+            result["stderr"] = stderr[-2000:]
+            return result
+        if i >= warmup:
+            samples.append(sample)
+
+    result["status"] = "ok"
+    result["wall"] = summary([s[0] for s in samples])
+    result["cpu"] = summary([s[1] for s in samples])
+    result["max_rss"] = max(s[2] for s in samples)
+    result["runs"] = [{"wall": s[0], "cpu": s[1], "max_rss": s[2]} for s in samples]
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="benchmark all dayN solver scripts")
+    parser.add_argument("days", nargs="*", type=int, help="only run these days (default: all)")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per script")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per script")
+    parser.add_argument("--timeout", type=float, default=300, help="seconds until a run is killed")
+    parser.add_argument("-o", "--output", help="json file (default: stdout)")
+    args = parser.parse_args()
+    assert (args.repeat > 0)
+
+    results = []
+    for script in find_scripts(args.days):
+        result = bench_script(script, args.warmup, args.repeat, args.timeout)
+        results.append(result)
+        if result["status"] == "ok":
+            print(f"{script:<30} {result['wall']['median']:9.4f}s wall {result['cpu']['median']:9.4f}s cpu "
+                  f"{result['max_rss'] / 2**20:8.1f} MiB", file=sys.stderr)
+        else:
+            print(f"{script:<30} {result['status']}", file=sys.stderr)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "warmup": args.warmup,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+'''
+input readers that never hold the whole file as a list of lines
+
+path "-" reads from stdin, so every reader also works at the end of a pipe
+'''
+import mmap
+import os
+import sys
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:  # numpy only where the vectorized readers are used
+    import numpy as np
+    from numpy.typing import NDArray
+
+
+@contextmanager
+def mapped(path: str) -> Iterator[bytes | mmap.mmap]:
+    # the os pages the file in on demand, slicing and bytes.find-like methods work without a copy
+    if path == "-":
+        yield sys.stdin.buffer.read()
+        return
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:  # mmap refuses empty files
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            yield m
+
+
+def iter_lines(path: str) -> Iterator[str]:
+    # lazy, one buffered line at a time, without the trailing newline
+    if path == "-":
+        for line in sys.stdin:
+            yield line.rstrip("\n")
+        return
+    with open(path) as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+def byte_array(data: str | bytes | mmap.mmap) -> "NDArray[np.uint8]":
+    # raw input as uint8 without a copy, a missing final newline is added so every line ends in one
+    import numpy as np
+
+    buf = np.frombuffer(data.encode() if isinstance(data, str) else data, dtype=np.uint8)
+    if len(buf) and buf[-1] != ord("\n"):
+        buf = np.append(buf, np.uint8(ord("\n")))
+    return buf
+
+
+def line_bounds(buf: "NDArray[np.uint8]") -> tuple["NDArray[np.intp]", "NDArray[np.intp]"]:
+    # start and newline position of every line of a byte_array
+    import numpy as np
+
+    ends = np.flatnonzero(buf == ord("\n"))
+    starts = np.concatenate(([0], ends + 1))[:len(ends)].astype(np.intp)
+    return starts, ends
+
+
+def records(lines: Iterable[str]) -> Iterator[list[str]]:
+    # blank line separated groups of lines, e.g. the elves of day 1
+    record: list[str] = []
+    for line in lines:
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
+
+
+def iter_records(path: str) -> Iterator[list[str]]:
+    return records(iter_lines(path))
@@ -0,0 +1,65 @@
+import importlib.util
+import os.path
+import re
+import sys
+from glob import glob
+from types import ModuleType
+
+root_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# solver used when only a day is given and there is no dayN/dayN.py
+DEFAULT_SCRIPTS: dict[int, str] = {
+    15: "day15/p2_shapely.py",
+    16: "day16/day16_better.py",
+    17: "day17/p2.py",
+    19: "day19/day19_linprog.py",
+    21: "day21/p2.py",
+    22: "day22/p2.py",
+}
+
+
+def day_of(script: str) -> int:
+    # "day16/p1.py" -> 16
+    match = re.match(r"day(\d+)", script)
+    assert (match)
+    return int(match[1])
+
+
+def find_scripts(days: list[int] | None = None) -> list[str]:
+    # every python file in a dayN folder is a standalone solver, paths relative to the repo root
+    scripts = [
+        os.path.relpath(path, root_path)
+        for path in glob(os.path.join(root_path, "day*", "*.py"))
+    ]
+    if days:
+        scripts = [script for script in scripts if day_of(script) in days]
+    return sorted(scripts, key=lambda script: (day_of(script), script))
+
+
+def input_path(script: str) -> str:
+    return os.path.join(root_path, os.path.dirname(script), "input.txt")
+
+
+def default_script(day: int) -> str:
+    if day in DEFAULT_SCRIPTS:
+        return DEFAULT_SCRIPTS[day]
+    return f"day{day}/day{day}.py"
+
+
+def module_name(script: str) -> str:
+    # "day16/p1.py" -> "day16.p1": run as python -m from the repo root, so the aoc package is importable
+    return os.path.splitext(script)[0].replace(os.sep, ".")
+
+
+def load_script(script: str) -> ModuleType:
+    # the day folders are no packages, so import the file directly.
+    # "day16/p1.py" -> module "day16_p1", registered before exec for dataclasses
+    name = os.path.splitext(script)[0].replace(os.sep, "_")
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(root_path, script))
+    assert (spec and spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
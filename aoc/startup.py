@@ -0,0 +1,119 @@
+'''
+cold start cost of every solver: a fresh interpreter imports the script (no solve)
+and -X importtime tells us where the time goes
+
+usage: python -m aoc.startup [days ...] [--repeat N] [-o FILE] [--baseline FILE]
+
+--baseline takes the json of an earlier run and prints the difference per script
+'''
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from time import perf_counter
+from typing import Any
+
+from aoc.solvers import find_scripts, root_path
+
+type Result = dict[str, Any]
+type Import = tuple[int, int, str]  # (self_us,cumulative_us,module)
+
+# import time:       self [us] |  cumulative | imported package
+# import time:       413 |        927 |   matplotlib.pyplot
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)")
+LOADER = "import sys; from aoc.solvers import load_script; load_script(sys.argv[1])"
+
+
+def cold_import(script: str | None) -> tuple[float, list[Import]]:
+    # script None -> only interpreter + loader, the baseline we subtract
+    cmd = [sys.executable, "-X", "importtime", "-c", LOADER if script else "import aoc.solvers"]
+    if script:
+        cmd.append(script)
+    start = perf_counter()
+    proc = subprocess.run(cmd, cwd=root_path, capture_output=True, text=True, env=os.environ | {"MPLBACKEND": "Agg"})
+    wall = perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr[-2000:])
+
+    imports: list[Import] = []
+    for line in proc.stderr.splitlines():
+        match = LINE.match(line)
+        # only top level imports (one space of indentation), nested ones are part of their cumulative time
+        if match and len(match[3]) == 1:
+            imports.append((int(match[1]), int(match[2]), match[4]))
+    return wall, imports
+
+
+def measure(script: str | None, repeat: int) -> tuple[float, dict[str, int]]:
+    # min over the runs: the least disturbed one
+    best_wall = float("inf")
+    best: dict[str, int] = {}
+    for _ in range(repeat):
+        wall, imports = cold_import(script)
+        best_wall = min(best_wall, wall)
+        for _, cumulative, module in imports:
+            best[module] = min(best.get(module, cumulative), cumulative)
+    return best_wall, best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="measure the cold start (import) cost of every solver")
+    parser.add_argument("days", nargs="*", type=int, help="only these days (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per script, min is reported")
+    parser.add_argument("--top", type=int, default=5, help="heaviest imports listed per script")
+    parser.add_argument("-o", "--output", help="json file (default: stdout)")
+    parser.add_argument("--baseline", help="json of an earlier run to compare against")
+    args = parser.parse_args()
+
+    base_wall, base_imports = measure(None, args.repeat)
+    base_us = sum(base_imports.values())
+
+    before: dict[str, Result] = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            before = {r["script"]: r for r in json.load(f)["results"]}
+
+    results: list[Result] = []
+    for script in find_scripts(args.days):
+        try:
+            wall, imports = measure(script, args.repeat)
+        except RuntimeError as e:
+            results.append({"script": script, "error": str(e)})
+            print(f"{script:<30} error", file=sys.stderr)
+            continue
+
+        # everything the interpreter + loader import anyway is not the script's fault
+        own = {m: us for m, us in imports.items() if m not in base_imports}
+        heaviest = sorted(own.items(), key=lambda x: x[1], reverse=True)[:args.top]
+        result: Result = {
+            "script": script,
+            "wall": wall,
+            "wall_over_baseline": wall - base_wall,
+            "import_us": sum(own.values()),
+            "heaviest": [{"module": m, "cumulative_us": us} for m, us in heaviest],
+        }
+        results.append(result)
+
+        line = f"{script:<30} {wall*1000:8.1f} ms wall {result['import_us']/1000:8.1f} ms imports"
+        if script in before and "import_us" in before[script]:
+            line += f" (before {before[script]['import_us']/1000:8.1f} ms)"
+        print(line, file=sys.stderr)
+
+    report = {
+        "python": sys.version.split()[0],
+        "repeat": args.repeat,
+        "baseline": {"wall": base_wall, "import_us": base_us},
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
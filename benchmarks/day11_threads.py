@@ -0,0 +1,91 @@
+'''
+day 11: thousands of independent monkey games in one process, back to back and in threads
+
+every game must give the same answers as a fresh run of its input, state left behind by
+an earlier game or shared with a concurrent one shows up as a mismatch
+
+usage: python -m benchmarks.day11_threads [--games N] [--threads N] [--repeat N] [--check N]
+'''
+import argparse
+import random
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from timeit import default_timer as timer
+
+from aoc.solvers import load_script, root_path
+
+day11 = load_script("day11/day11.py")
+FRESH = "import sys; from aoc.solvers import load_script; print(load_script('day11/day11.py').solve(sys.stdin.read()))"
+
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]
+
+
+def generate(monkeys: int, seed: int) -> str:
+    rng = random.Random(seed)
+    divisors = rng.sample(PRIMES, monkeys)
+    square = rng.randrange(monkeys)
+    blocks = []
+    for i in range(monkeys):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        if i == square:
+            op = "old * old"
+        elif rng.random() < 0.3:
+            op = f"old * {rng.randint(2, 19)}"
+        else:
+            op = f"old + {rng.randint(1, 8)}"
+        if_true = rng.choice([j for j in range(monkeys) if j != i])
+        if_false = rng.choice([j for j in range(monkeys) if j not in (i, if_true)])
+        blocks.append(
+            f"Monkey {i}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = {op}\n"
+            f"  Test: divisible by {divisors[i]}\n"
+            f"    If true: throw to monkey {if_true}\n"
+            f"    If false: throw to monkey {if_false}"
+        )
+    return "\n\n".join(blocks) + "\n"
+
+
+def run_all(games: list[str], threads: int) -> tuple[float, list[tuple[int, int]]]:
+    start = timer()
+    if threads == 1:
+        res = [day11.solve(data) for data in games]
+    else:
+        with ThreadPoolExecutor(threads) as pool:
+            res = list(pool.map(day11.solve, games))
+    return timer() - start, res
+
+
+def solve_fresh(data: str) -> tuple[int, int]:
+    # reference without any earlier game in the same interpreter
+    out = subprocess.run([sys.executable, "-c", FRESH], input=data, capture_output=True, text=True,
+                         cwd=root_path, check=True).stdout
+    p1, p2 = out.strip("()\n").split(", ")
+    return (int(p1), int(p2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=1000, help="number of different inputs")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=1, help="passes over all games")
+    parser.add_argument("--check", type=int, default=20, help="games checked in a fresh interpreter")
+    args = parser.parse_args()
+
+    games = [generate(random.Random(seed).randint(3, 8), seed) for seed in range(args.games)]
+    t_first, expected = run_all(games, 1)
+    print(f"{args.games} games, back to back: {t_first:8.4f}s")
+    for j in random.Random(0).sample(range(args.games), min(args.check, args.games)):
+        assert solve_fresh(games[j]) == expected[j], "first pass differs from a fresh interpreter"
+
+    for i in range(args.repeat):
+        t_serial, res = run_all(games, 1)
+        assert res == expected, "state leaked between games"
+        # a different order in every pass, so neighbouring games change
+        order = list(range(args.games))
+        random.Random(i).shuffle(order)
+        t_threads, res = run_all([games[j] for j in order], args.threads)
+        assert [expected[j] for j in order] == res, "concurrent games interfered"
+        print(f"pass {i+1}: back to back {t_serial:8.4f}s, {args.threads} threads {t_threads:8.4f}s")
+    print("all games matched")
@@ -0,0 +1,59 @@
+'''
+day 12: repairing the distance field after a height edit vs searching the whole map again
+
+a gentle slope with noise, every edit gives one random cell a random height, which can open
+a shortcut or wall off a path: the repair follows the cells that depend on the edit,
+the full search grows with the map
+
+usage: python -m benchmarks.day12_edits [--sizes N ...] [--edits N]
+'''
+import argparse
+import random
+from timeit import default_timer as timer
+
+from aoc.solvers import load_script
+
+day12 = load_script("day12/day12.py")
+
+
+def generate(size: int, seed: int = 1) -> str:
+    rng = random.Random(seed)
+    rows = [[chr(ord("a") + min(25, x*26//size + (rng.random() < 0.2))) for x in range(size)] for _ in range(size)]
+    rows[0][0] = "S"
+    rows[size//2][size-1] = "E"
+    return "\n".join("".join(row) for row in rows) + "\n"
+
+
+def edits(size: int, n: int, hm, seed: int = 2) -> list[tuple[int, int, str]]:
+    # start and end stay
+    rng = random.Random(seed)
+    res = []
+    while len(res) < n:
+        x, y = rng.randrange(size), rng.randrange(size)
+        if hm.index(x, y) not in (hm.start, hm.end):
+            res.append((x, y, rng.choice("abcdefghijklmnopqrstuvwxyz")))
+    return res
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 300, 1000])
+    parser.add_argument("--edits", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'full search':>12} {'per edit':>12} {'cells/edit':>11} {'max cells':>10}")
+    for size in args.sizes:
+        hm = day12.parse(generate(size))
+        start = timer()
+        field = day12.DistanceField(hm)
+        t_full = timer() - start
+
+        todo = edits(size, args.edits, hm)
+        repaired = []
+        start = timer()
+        for x, y, height in todo:
+            repaired.append(field.set_height(x, y, height))
+        t_edit = (timer() - start) / len(todo)
+
+        assert field.dist == day12.distances_to_end(hm), "repaired field differs from a full search"
+        print(f"{size:>6} {t_full:11.4f}s {t_edit*1e3:10.4f}ms {sum(repaired)/len(repaired):11.1f} {max(repaired):10}")
@@ -0,0 +1,55 @@
+'''
+day 13: eval (the original parser) vs the packet tokenizer on generated deeply nested packets
+
+usage: python -m benchmarks.day13_parse [--pairs N] [--depth N] [--repeat N]
+'''
+import argparse
+import json
+import random
+from timeit import default_timer as timer
+
+from aoc.bench import best_of
+from aoc.solvers import load_script
+
+day13 = load_script("day13/day13.py")
+
+
+def packet(depth: int, rng: random.Random) -> list:
+    # one nested spine with a few ints and short lists around it on every level
+    items: list = [rng.randint(0, 10) if rng.random() < 0.7 else [rng.randint(0, 10)] for _ in range(rng.randint(0, 3))]
+    if depth:
+        items.insert(rng.randint(0, len(items)), packet(depth-1, rng))
+    return items
+
+
+def generate(pairs: int, depth: int, seed: int = 1) -> str:
+    rng = random.Random(seed)
+    lines = [json.dumps(packet(rng.randint(1, depth), rng), separators=(",", ":")) for _ in range(2*pairs)]
+    return "\n\n".join(f"{left}\n{right}" for left, right in zip(lines[::2], lines[1::2])) + "\n"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", type=int, default=10_000)
+    parser.add_argument("--depth", type=int, default=60, help="maximum nesting, eval gives up at about 200")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data = generate(args.pairs, args.depth)
+    lines = [line for line in data.splitlines() if line]
+    print(f"{len(lines)} packets, depth up to {args.depth}, {len(data) / 2**20:.1f} MiB")
+
+    t_eval, expected = best_of(lambda: [eval(line) for line in lines], args.repeat)
+    print(f"eval:       {t_eval:8.4f}s")
+    t_parse, res = best_of(lambda: list(day13.packets(lines)), args.repeat)
+    assert res == expected
+    print(f"tokenizer:  {t_parse:8.4f}s  ({t_eval / t_parse:.2f}x)")
+    t_json, res = best_of(lambda: [json.loads(line) for line in lines], args.repeat)
+    assert res == expected
+    print(f"json.loads: {t_json:8.4f}s  ({t_eval / t_json:.2f}x, C, for reference)")
+
+    # the tokenizer has no depth limit
+    deep = "[" * 100_000 + "1" + "]" * 100_000
+    start = timer()
+    day13.parse_packet(deep)
+    print(f"depth 100000: {timer() - start:.4f}s")
@@ -0,0 +1,51 @@
+'''
+day 13: sorting packets with cmp_to_key(in_order) vs the flat sort_key tuples
+
+every run first checks sort_key against in_order on random pairs, empty lists and
+ints wrapped in lists included, a key that orders differently fails the assert
+
+usage: python -m benchmarks.day13_sort [--pairs N] [--depth N] [--check N] [--repeat N]
+'''
+import argparse
+import random
+from functools import cmp_to_key
+
+from aoc.bench import best_of
+from aoc.solvers import load_script
+from benchmarks.day13_parse import generate
+
+day13 = load_script("day13/day13.py")
+
+
+def small_packet(rng: random.Random, depth: int = 4) -> list:
+    # few distinct values and short lists, so equal prefixes, ties and promotions are common
+    return [rng.randint(0, 3) if depth == 0 or rng.random() < 0.4 else small_packet(rng, depth-1)
+            for _ in range(rng.randint(0, 3))]
+
+
+def check(pairs: int, seed: int = 3) -> None:
+    rng = random.Random(seed)
+    for _ in range(pairs):
+        left, right = small_packet(rng), small_packet(rng)
+        kl, kr = day13.sort_key(left), day13.sort_key(right)
+        assert day13.in_order(left, right) == (kl > kr) - (kl < kr), f"sort_key disagrees on {left} vs {right}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", type=int, default=20_000)
+    parser.add_argument("--depth", type=int, default=20)
+    parser.add_argument("--check", type=int, default=200_000, help="random pairs compared against in_order")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    check(args.check)
+    print(f"{args.check} random pairs: sort_key matches in_order")
+
+    packets = list(day13.packets(generate(args.pairs, args.depth).splitlines()))
+    print(f"{len(packets)} packets, depth up to {args.depth}")
+    t_cmp, expected = best_of(lambda: sorted(packets, key=cmp_to_key(day13.in_order)), args.repeat)
+    print(f"cmp_to_key: {t_cmp:8.4f}s")
+    t_key, res = best_of(lambda: sorted(packets, key=day13.sort_key), args.repeat)
+    assert [day13.sort_key(p) for p in res] == [day13.sort_key(p) for p in expected]
+    print(f"sort_key:   {t_key:8.4f}s  ({t_cmp / t_key:.2f}x)")
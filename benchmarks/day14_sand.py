@@ -0,0 +1,60 @@
+'''
+day 14 part 2: dropping every grain (pour) vs filling the sand triangle row by row (fill)
+
+every run first checks fill against pour on random small caves, same count and the same
+grid afterwards, then times both on generated caves of growing depth
+
+usage: python -m benchmarks.day14_sand [--depths N ...] [--check N] [--repeat N]
+'''
+import argparse
+import random
+
+from aoc.bench import best_of
+from aoc.solvers import load_script
+
+day14 = load_script("day14/day14.py")
+
+
+def generate(depth: int, walls: int, seed: int = 1) -> str:
+    # random rock paths under the hole, down to depth
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(walls):
+        x, y = rng.randint(500-depth, 500+depth), rng.randint(1, depth)
+        points = [(x, y)]
+        for _ in range(rng.randint(1, 4)):
+            if rng.random() < 0.5:
+                x += rng.randint(-6, 6)
+            else:
+                y = max(1, y + rng.randint(-6, 6))
+            points.append((x, y))
+        lines.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return "\n".join(lines) + "\n"
+
+
+def check(caves: int, seed: int = 5) -> None:
+    rng = random.Random(seed)
+    for i in range(caves):
+        data = generate(rng.randint(3, 30), rng.randint(1, 15), seed=seed + i)
+        dropped, filled = day14.parse(data, floor=True), day14.parse(data, floor=True)
+        assert day14.pour(dropped) == day14.fill(filled), f"fill disagrees with pour on\n{data}"
+        assert dropped.cells == filled.cells, f"fill leaves a different grid than pour on\n{data}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--depths", nargs="+", type=int, default=[100, 300, 1000])
+    parser.add_argument("--check", type=int, default=300, help="random caves compared against pour")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    check(args.check)
+    print(f"{args.check} random caves: fill matches pour")
+
+    print(f"{'depth':>6} {'grains':>9} {'pour':>9} {'fill':>9}")
+    for depth in args.depths:
+        data = generate(depth, depth)
+        t_pour, expected = best_of(lambda: day14.pour(day14.parse(data, floor=True)), args.repeat)
+        t_fill, res = best_of(lambda: day14.fill(day14.parse(data, floor=True)), args.repeat)
+        assert res == expected
+        print(f"{depth:>6} {res:>9} {t_pour:8.4f}s {t_fill:8.4f}s  ({t_pour / t_fill:.1f}x)")
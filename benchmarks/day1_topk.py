@@ -0,0 +1,52 @@
+'''
+day 1: full sort (the original solution) vs streaming heap vs numpy on generated elves
+
+usage: python -m benchmarks.day1_topk [--elves N] [-k K] [--repeat N]
+'''
+import argparse
+import random
+
+from aoc.bench import best_of
+from aoc.solvers import load_script
+
+day1 = load_script("day1/day1.py")
+
+
+def generate(elves: int, seed: int = 1) -> str:
+    rng = random.Random(seed)
+    return "\n\n".join(
+        "\n".join(str(rng.randint(1_000, 60_000)) for _ in range(rng.randint(1, 15)))
+        for _ in range(elves)
+    ) + "\n"
+
+
+def top_sorted(data: str, k: int) -> list[int]:
+    calories = sorted([sum(map(int, elve.splitlines())) for elve in data.split("\n\n")])
+    return calories[::-1][:k]
+
+
+def top_heap(data: str, k: int) -> list[int]:
+    return day1.top_calories((elve.splitlines() for elve in data.split("\n\n")), k)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--elves", type=int, default=1_000_000)
+    parser.add_argument("-k", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data = generate(args.elves)
+    print(f"{args.elves} elves, {len(data) / 2**20:.1f} MiB, k={args.k}")
+
+    t_sort, expected = best_of(lambda: top_sorted(data, args.k), args.repeat)
+    print(f"sort:  {t_sort:8.4f}s")
+    t_heap, res = best_of(lambda: top_heap(data, args.k), args.repeat)
+    assert (res == expected)
+    print(f"heap:  {t_heap:8.4f}s  ({t_sort / t_heap:.2f}x)")
+    try:
+        t_np, res = best_of(lambda: day1.top_calories_numpy(data, args.k), args.repeat)
+        assert (res == expected)
+        print(f"numpy: {t_np:8.4f}s  ({t_sort / t_np:.2f}x)")
+    except ImportError:
+        print("numpy: not installed")
@@ -0,0 +1,68 @@
+'''
+day 7: where the time goes for a generated log of many folders, next to a bare python loop over the same lines
+
+usage: python -m benchmarks.day7_tree [--folders N ...] [--repeat N]
+'''
+import argparse
+import random
+
+from aoc.bench import best_of
+from aoc.solvers import load_script
+
+day7 = load_script("day7/day7.py")
+
+
+def generate(folders: int, seed: int = 1) -> list[str]:
+    # random tree, walked depth first like the puzzle log: every folder is listed once, then entered
+    rng = random.Random(seed)
+    children: list[list[int]] = [[] for _ in range(folders)]
+    for i in range(1, folders):
+        children[rng.randrange(max(0, i-50), i)].append(i)
+
+    lines = ["$ cd /"]
+
+    def ls(folder: int) -> None:
+        lines.append("$ ls")
+        lines.extend(f"dir d{child}" for child in children[folder])
+        lines.extend(f"{rng.randint(1, 300_000)} f{rng.randint(0, 999)}.txt" for _ in range(rng.randint(0, 4)))
+
+    ls(0)
+    stack = [iter(children[0])]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            if stack:
+                lines.append("$ cd ..")
+            continue
+        lines.append(f"$ cd d{child}")
+        ls(child)
+        stack.append(iter(children[child]))
+    return lines
+
+
+def bare_loop(lines: list[str]) -> int:
+    # the floor for any per-line parser: look at the first character of every line
+    n = 0
+    for line in lines:
+        if line[:1] == "$":
+            n += 1
+    return n
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--folders", nargs="+", type=int, default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'folders':>9} {'lines':>9} {'bare loop':>10} {'parse':>9} {'aggregate':>10} {'solve':>9}")
+    for folders in args.folders:
+        lines = generate(folders)
+        t_bare, _ = best_of(lambda: bare_loop(lines), args.repeat)
+        t_parse, (parent, size) = best_of(lambda: day7.parse(lines), args.repeat)
+        assert len(parent) == folders
+        t_agg, _ = best_of(lambda: day7.aggregate(parent, size[:]), 1)
+        day7.aggregate(parent, size)
+        t_solve, _ = best_of(lambda: day7.solve_sizes(size), args.repeat)
+        print(f"{folders:>9} {len(lines):>9} {t_bare:9.3f}s {t_parse:8.3f}s {t_agg:9.3f}s {t_solve:8.3f}s")
@@ -1,11 +1,61 @@
+import argparse
 import os.path
+from heapq import nlargest
+from typing import Iterable
+
+from aoc.inputs import byte_array, iter_records, line_bounds, mapped, records
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
 
-data = open(input_path).read().split("\n\n")
 
-calories = sorted([sum(map(int, elve.splitlines())) for elve in data])
+def top_calories(elves: Iterable[list[str]], k: int = 3) -> list[int]:
+    # nlargest keeps a min-heap of size k: O(n log k) time, O(k) memory, one elf at a time
+    return nlargest(k, (sum(map(int, elve)) for elve in elves))
+
+
+def top_calories_numpy(data: str | bytes, k: int = 3) -> list[int]:
+    # whole input in memory: parse the raw bytes with array operations, no python loop per line
+    import numpy as np
+
+    buf = byte_array(data)
+    starts, nl = line_bounds(buf)
+    # an elf starts at a line after a blank one (or the first line), runs of blank lines open nothing
+    blank = nl == starts
+    keep = ~blank
+    if not keep.any():
+        return []
+    opens = np.flatnonzero(np.concatenate(([True], blank[:-1]))[keep])
+    starts, nl = starts[keep], nl[keep]
+
+    # one row per line with the digits right aligned
+    width = int((nl - starts).max())
+    idx = nl[:, None] - width + np.arange(width)
+    digits = np.where(idx >= starts[:, None], buf[np.maximum(idx, 0)], ord("0")).astype(np.int64) - ord("0")
+    values = digits @ 10**np.arange(width-1, -1, -1)
+    totals = np.add.reduceat(values, opens)
+
+    k = min(k, len(totals))
+    top = np.partition(totals, len(totals)-k)[len(totals)-k:]
+    return sorted(top.tolist(), reverse=True)
+
+
+def solve(data: str) -> tuple[int, int]:
+    top = top_calories(records(data.splitlines()))
+    return (top[0], sum(top))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", nargs="?", default=input_path, help="input file, - for stdin")
+    parser.add_argument("-k", type=int, default=3, help="number of elves for part 2")
+    parser.add_argument("--numpy", action="store_true", help="read everything and use the vectorized path")
+    args = parser.parse_args()
 
-print("Part 1:", calories[-1])
-print("Part 2:", sum(calories[-3:]))
+    if args.numpy:
+        with mapped(args.input) as m:
+            top = top_calories_numpy(m, args.k)
+    else:
+        top = top_calories(iter_records(args.input), args.k)
+    print("Part 1:", top[0])
+    print("Part 2:", sum(top))
@@ -1,34 +1,103 @@
+import argparse
 import os.path
+from itertools import islice, repeat
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+from aoc.inputs import iter_lines
+
+type Instruction = tuple[int, Callable[..., int]]  # cycles, x after the last cycle from x and the int arguments
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
-data = open(input_path).read().splitlines()
-
-x = 1
-values = []  # saves "during"
-for instr in data:
-    if instr.startswith("n"):
-        values.append(x)
-        continue
-    y = int(instr.split(" ", 1)[1])
-    values.append(x)
-    values.append(x)
-    x += y
-
-ans = sum(values[i-1]*i for i in (20, 60, 100, 140, 180, 220))
-print("Part 1:", ans)
-
-crt = ""
-for j in range(6):
-    row = ""
-    for i in range(40):
-        pixel = j*40 + i
-        x = values[pixel]
-        if abs(x - i) <= 1:
-            row += "#"
-        else:
-            row += "."
-    crt += row + "\n"
-
-print("Part 2:")
-print(crt)
+
+INSTRUCTIONS: dict[str, Instruction] = {
+    "noop": (1, lambda x: x),
+    "addx": (2, lambda x, y: x + y),
+}
+SAMPLES = range(20, 221, 40)
+
+
+def steps(program: Iterable[str], instructions: dict[str, Instruction] = INSTRUCTIONS) -> Iterator[tuple[int, int]]:
+    # cycles of every instruction and x during them
+    x = 1
+    decoded: dict[str, tuple[int, Callable[..., int], tuple[int, ...]]] = {}  # programs repeat a few distinct lines
+    for instr in program:
+        d = decoded.get(instr)
+        if d is None:
+            op, *args = instr.split()
+            cycles, execute = instructions[op]
+            d = decoded[instr] = (cycles, execute, tuple(map(int, args)))
+        cycles, execute, args = d
+        yield cycles, x
+        x = execute(x, *args)
+
+
+def register_values(program: Iterable[str], instructions: dict[str, Instruction] = INSTRUCTIONS) -> Iterator[int]:
+    # x "during" every cycle
+    for cycles, x in steps(program, instructions):
+        yield from repeat(x, cycles)
+
+
+def register_array(program: Iterable[str], cycles: int, instructions: dict[str, Instruction] = INSTRUCTIONS) -> NDArray:
+    # x during cycle c at index c-1 for the first cycles only, stops reading the program after that
+    return np.fromiter(islice(register_values(program, instructions), cycles), dtype=np.int64)
+
+
+def signal_strength(values: Iterable[int], cycles: Iterable[int] = SAMPLES) -> int:
+    # streaming, stops reading after the last sampled cycle
+    wanted = set(cycles)
+    last = max(wanted, default=0)
+    ans = 0
+    for cycle, x in enumerate(values, 1):
+        if cycle in wanted:
+            ans += cycle*x
+        if cycle >= last:
+            break
+    return ans
+
+
+def signal_strength_numpy(xs: NDArray, cycles: Iterable[int] = SAMPLES) -> int:
+    c = np.unique(np.fromiter(cycles, dtype=np.int64))
+    c = c[(c >= 1) & (c <= len(xs))]
+    return int((c * xs[c-1]).sum())
+
+
+def render(xs: NDArray, width: int = 40, height: int = 6) -> NDArray:
+    # lit pixels, the crt draws pixel c-1 during cycle c, a short program leaves the rest dark
+    n = min(len(xs), width*height)
+    lit = np.zeros(width*height, dtype=np.bool_)
+    lit[:n] = np.abs(xs[:n] - np.arange(n) % width) <= 1
+    return lit.reshape(height, width)
+
+
+def to_text(lit: NDArray) -> str:
+    pixels = np.where(lit, np.uint8(ord("#")), np.uint8(ord(".")))
+    newlines = np.full((len(lit), 1), ord("\n"), dtype=np.uint8)
+    return np.hstack((pixels, newlines)).tobytes().decode()
+
+
+def run(program: Iterable[str], width: int = 40, height: int = 6, samples: Iterable[int] = SAMPLES) -> tuple[int, str]:
+    samples = list(samples)
+    xs = register_array(program, max(max(samples, default=0), width*height))
+    return (signal_strength_numpy(xs, samples), to_text(render(xs, width, height)))
+
+
+def solve(data: str) -> tuple[int, str]:
+    return run(data.splitlines())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", nargs="?", default=input_path, help="input file, - for stdin")
+    parser.add_argument("--width", type=int, default=40)
+    parser.add_argument("--height", type=int, default=6)
+    parser.add_argument("--samples", nargs="+", type=int, default=SAMPLES, help="cycles for the signal strength")
+    args = parser.parse_args()
+
+    p1, p2 = run(iter_lines(args.input), args.width, args.height, args.samples)
+    print("Part 1:", p1)
+    print("Part 2:")
+    print(p2)
@@ -1,7 +1,11 @@
 import os.path
 from dataclasses import dataclass, field
+from math import lcm
 from operator import add, mul, pow
-from typing import Callable, ClassVar
+from typing import Callable
+
+import numpy as np
+from numpy.typing import NDArray
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
@@ -11,7 +15,6 @@ OP = {"+": add, "*": mul}
 
 @dataclass(slots=True)
 class Monkey:
-    mod: ClassVar[int] = 1
     id: int
     inspect_operation: Callable[[int, int], int]
     inspect_operand: int
@@ -24,33 +27,6 @@ class Monkey:
     def add_item(self, item: int) -> None:
         self.items.append(item)
 
-    def play(self, bored_level: int) -> list[tuple[int, int]]:  # (item,to_monkey)
-        res = []
-        self.inspect_items()
-        if bored_level > 1:
-            self.bored(bored_level)
-        self.prune_items()  # important for p2 since numbers grow fast
-        for item in self.items:
-            if self.test_item(item):
-                res.append((item, self.test_true))
-            else:
-                res.append((item, self.test_false))
-        self.items = []
-        return res
-
-    def inspect_items(self) -> None:
-        self.total_inspects += len(self.items)
-        self.items = [self.inspect_operation(item, self.inspect_operand) for item in self.items]
-
-    def bored(self, level: int) -> None:
-        self.items = [item // level for item in self.items]
-
-    def test_item(self, item: int) -> bool:
-        return item % self.test_divisor == 0
-
-    def prune_items(self) -> None:
-        self.items = [item % Monkey.mod for item in self.items]
-
 
 def create_monkeys(data: str) -> dict[int, Monkey]:
     monkeys_str = data.split("\n\n")
@@ -71,32 +47,138 @@ def create_monkeys(data: str) -> dict[int, Monkey]:
         test_false = int(monkey_lines[5].split(" ")[-1])
 
         monkey = Monkey(i, inspect_operation, inspect_operand, test_divisor, test_true, test_false)
-        # https://en.wikipedia.org/wiki/Chinese_remainder_theorem
-        # all divisors are prime
-        Monkey.mod *= test_divisor
         for item_str in items_str.split(", "):
             monkey.add_item(int(item_str))
         monkeys[i] = monkey
     return monkeys
 
 
-def play_a_round(monkeys: dict[int, Monkey], bored_level: int) -> None:
+def tables(monkeys: dict[int, Monkey]) -> tuple[NDArray[np.int64], ...]:
+    # one entry per monkey: worry -> worry * (worry if square else factor) + addend, then the test
+    ids = sorted(monkeys)
+    square = np.array([monkeys[i].inspect_operation is pow for i in ids])
+    factor = np.array([monkeys[i].inspect_operand if monkeys[i].inspect_operation is mul else 1 for i in ids], dtype=np.int64)
+    addend = np.array([monkeys[i].inspect_operand if monkeys[i].inspect_operation is add else 0 for i in ids], dtype=np.int64)
+    divisor = np.array([monkeys[i].test_divisor for i in ids], dtype=np.int64)
+    if_true = np.array([monkeys[i].test_true for i in ids], dtype=np.int64)
+    if_false = np.array([monkeys[i].test_false for i in ids], dtype=np.int64)
+    return square, factor, addend, divisor, if_true, if_false
+
+
+@dataclass(slots=True)
+class Simulation:
+    # everything one game needs, nothing lives on the classes: games can run side by side in threads
+    monkeys: dict[int, Monkey]
+    mod: int = field(init=False)
+    tables: tuple[NDArray[np.int64], ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # https://en.wikipedia.org/wiki/Chinese_remainder_theorem
+        # every test only looks at the worry modulo its divisor
+        self.mod = lcm(*(monkey.test_divisor for monkey in self.monkeys.values()))
+        self.tables = tables(self.monkeys)
+
+
+def play(sim: Simulation, bored_level: int, rounds: int) -> None:
+    # all items in one array tagged with their monkey, items never interact:
+    # every step moves all items that are still on their way in this round at once
+    monkeys, mod = sim.monkeys, sim.mod
+    square, factor, addend, divisor, if_true, if_false = sim.tables
+    owner = np.array([monkey.id for monkey in monkeys.values() for _ in monkey.items], dtype=np.int64)
+    items = [item for monkey in monkeys.values() for item in monkey.items]
+    # worry < mod after the first inspection, the starting items can be larger: worry * worry has to fit
+    dtype = np.int64 if max([mod, *items]) < 3_000_000_000 else object
+    worry = np.array(items, dtype=dtype)
+    inspects = np.zeros(len(monkeys), dtype=np.int64)
+    everyone = np.arange(len(worry))
+
+    for _ in range(rounds):
+        moving = everyone
+        while len(moving):
+            o = owner[moving]
+            w = worry[moving]
+            inspects += np.bincount(o, minlength=len(monkeys))
+            w = w * np.where(square[o], w, factor[o]) + addend[o]
+            if bored_level > 1:
+                w //= bored_level
+            w %= mod  # important for p2 since numbers grow fast
+            to = np.where(w % divisor[o] == 0, if_true[o], if_false[o])
+            worry[moving] = w
+            owner[moving] = to
+            # a monkey later in the round inspects the item again in this round, an earlier one next round
+            moving = moving[to > o]
+
     for monkey in monkeys.values():
-        throws = monkey.play(bored_level)
-        for (item, to_monkey) in throws:
-            monkeys[to_monkey].add_item(item)
+        monkey.items = worry[owner == monkey.id].tolist()
+        monkey.total_inspects += int(inspects[monkey.id])
+
+
+def play_cycles(sim: Simulation, rounds: int) -> None:
+    # without boredom an item is just (monkey, worry % mod) at the start of a round,
+    # its own state decides everything: follow every item until a state repeats,
+    # then the inspections of any number of rounds follow from the cycle
+    monkeys, mod = sim.monkeys, sim.mod
+    square, factor, addend, divisor, if_true, if_false = (t.tolist() for t in sim.tables)
+    inspects = [0]*len(monkeys)
+    final: list[tuple[int, int]] = []
+
+    for monkey in monkeys.values():
+        for item in monkey.items:
+            state = (monkey.id, item % mod)
+            seen: dict[tuple[int, int], int] = {}  # state -> first round it started in
+            states: list[tuple[int, int]] = []
+            visits: list[list[int]] = []  # inspecting monkeys of every round
+            while len(states) < rounds and state not in seen:
+                seen[state] = len(states)
+                states.append(state)
+                o, w = state
+                visit = []
+                while True:
+                    visit.append(o)
+                    w = (w*w if square[o] else w*factor[o]) + addend[o]
+                    w %= mod
+                    thrower, o = o, if_true[o] if w % divisor[o] == 0 else if_false[o]
+                    if o <= thrower:  # the catcher has already played this round
+                        break
+                visits.append(visit)
+                state = (o, w)
+
+            if len(states) == rounds:  # no repeat within the rounds asked for
+                for visit in visits:
+                    for o in visit:
+                        inspects[o] += 1
+                final.append(state)
+                continue
+            start = seen[state]
+            full, rest = divmod(rounds - start, len(states) - start)
+            for r, visit in enumerate(visits):
+                times = 1 if r < start else full + (r - start < rest)
+                for o in visit:
+                    inspects[o] += times
+            final.append(states[start + rest])
+
+    for monkey in monkeys.values():
+        monkey.items = [w for o, w in final if o == monkey.id]
+        monkey.total_inspects += inspects[monkey.id]
 
 
 def monkey_business(monkeys: dict[int, Monkey], bored_level: int, rounds: int) -> int:
-    for _ in range(rounds):
-        play_a_round(monkeys, bored_level)
+    sim = Simulation(monkeys)
+    if bored_level == 1:
+        play_cycles(sim, rounds)  # independent of the number of rounds
+    else:
+        play(sim, bored_level, rounds)
     activity = sorted([monkey.total_inspects for monkey in monkeys.values()])
     return activity[-1]*activity[-2]
 
 
-data = open(input_path).read()
-monkeys = create_monkeys(data)
-print("Part 1:", monkey_business(monkeys, 3, 20))
+def solve(data: str) -> tuple[int, int]:
+    p1 = monkey_business(create_monkeys(data), 3, 20)
+    p2 = monkey_business(create_monkeys(data), 1, 10000)
+    return (p1, p2)
+
 
-monkeys = create_monkeys(data)
-print("Part 2:", monkey_business(monkeys, 1, 10000))
+if __name__ == "__main__":
+    p1, p2 = solve(open(input_path).read())
+    print("Part 1:", p1)
+    print("Part 2:", p2)
@@ -1,62 +1,157 @@
+import argparse
 import os.path
-from collections import deque
+from dataclasses import dataclass
+from heapq import heapify, heappop, heappush
 from math import inf
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
 
+UNREACHABLE = -1
 
-def build_graph(data: str) -> tuple[dict[complex, int], complex, complex]:
-    data_split = data.splitlines()
-    grid: dict[complex, int] = {}
-    start, end = 0, 0
-    for j, row in enumerate(data_split):
-        for i, c in enumerate(row):
-            pos = i+j*1j
-            if c == "S":
-                start = pos
-                val = ord("a")
-            elif c == "E":
-                end = pos
-                val = ord("z")
-            else:
-                val = ord(c)
-            grid[pos] = val
-    return (grid, start, end)
-
-
-def bfs(graph: dict[complex, int], starts: list[complex], end: complex) -> int | float:
+
+@dataclass(slots=True)
+class Heightmap:
+    # flat, row by row, with a border of height 0 around it: nothing can be reached from there,
+    # so neighbours never need a bounds check
+    heights: bytearray
+    width: int  # including the border
+    start: int
+    end: int
+
+    def index(self, x: int, y: int) -> int:
+        # the border must stay at height 0, it is outside the map
+        rows = len(self.heights)//self.width - 2
+        if not (0 <= x < self.width-2 and 0 <= y < rows):
+            raise ValueError(f"cell {x},{y} is outside the {self.width-2}x{rows} map")
+        return (y+1)*self.width + x+1
+
+
+def parse(data: str) -> Heightmap:
+    rows = data.splitlines()
+    width = len(rows[0]) + 2
+    heights = bytearray(width)
+    for row in rows:
+        heights += b"\0" + row.encode() + b"\0"
+    heights += bytearray(width)
+    start, end = heights.index(b"S"), heights.index(b"E")
+    heights[start], heights[end] = ord("a"), ord("z")
+    return Heightmap(heights, width, start, end)
+
+
+def distances_to_end(hm: Heightmap) -> list[int]:
     '''
-    bfs checks ALL path with length 0, then ALL with length 1 etc
-    similar to how dijkstra with prio queue works
+    bfs backwards from end, one level at a time: a step u -> v is allowed if heights[v] <= heights[u] + 1,
+    so v is reached backwards from every neighbour u with heights[u] >= heights[v] - 1
+    the result is the distance from every cell to end, any start is a lookup
     '''
-    init = [(start, 0) for start in starts]
-    q: deque[tuple[complex, int]] = deque(init)
-    seen: set[complex] = set(starts)
+    heights, width = hm.heights, hm.width
+    dist = [UNREACHABLE]*len(heights)
+    dist[hm.end] = 0
+    frontier = [hm.end]
+    steps = 0
+    while frontier:
+        steps += 1
+        reached = []
+        for v in frontier:
+            lowest = heights[v] - 1
+            for u in (v-1, v+1, v-width, v+width):
+                if dist[u] == UNREACHABLE and heights[u] >= lowest:
+                    dist[u] = steps
+                    reached.append(u)
+        frontier = reached
+    return dist
+
+
+def shortest(dist: list[int], cells: list[int]) -> int | float:
+    return min((dist[cell] for cell in cells if dist[cell] != UNREACHABLE), default=inf)
+
+
+class DistanceField:
+    '''
+    distances to end for a heightmap that keeps changing
+    an edit only repairs the cells whose distance depends on it instead of searching again
+    '''
+    def __init__(self, hm: Heightmap) -> None:
+        self.hm = hm
+        self.dist = distances_to_end(hm)
+
+    def steps_from(self, x: int, y: int) -> int | float:
+        return shortest(self.dist, [self.hm.index(x, y)])
+
+    def set_height(self, x: int, y: int, height: str) -> int:
+        # returns how many cells had to be repaired
+        if len(height) != 1 or not "a" <= height <= "z":
+            raise ValueError(f"height must be a letter a-z, got {height!r}")
+        heights, width, dist = self.hm.heights, self.hm.width, self.dist
+        cell = self.hm.index(x, y)
+        heights[cell] = ord(height)
+        # every step that appeared or vanished starts at the cell or one of its neighbours
+        around = [u for u in (cell, cell-1, cell+1, cell-width, cell+width) if heights[u]]
+
+        # longer: a cell is lost once no neighbour one step closer is left to walk to,
+        # in the order of the old distances so the neighbours closer to end are already decided
+        lost: set[int] = set()
+        heap = [(dist[u], u) for u in around if dist[u] > 0]
+        heapify(heap)
+        while heap:
+            d, u = heappop(heap)
+            if u in lost:
+                continue
+            if any(dist[v] == d-1 and v not in lost and heights[v] <= heights[u] + 1
+                   for v in (u-1, u+1, u-width, u+width)):
+                continue
+            lost.add(u)
+            for p in (u-1, u+1, u-width, u+width):
+                if dist[p] == d+1 and heights[u] <= heights[p] + 1:
+                    heappush(heap, (d+1, p))
+        for u in lost:
+            dist[u] = UNREACHABLE
 
-    while q:
-        pos, steps = q.popleft()
+        # shorter: lost cells and the cells around the edit start from their best neighbour,
+        # improvements spread backwards like in the bfs, a heap because they start at different distances
+        heap = []
+        for u in lost.union(around):
+            best = min((dist[v] + 1 for v in (u-1, u+1, u-width, u+width)
+                        if dist[v] != UNREACHABLE and heights[v] <= heights[u] + 1), default=UNREACHABLE)
+            if best != UNREACHABLE and (dist[u] == UNREACHABLE or best < dist[u]):
+                heap.append((best, u))
+        heapify(heap)
+        repaired = lost.copy()
+        while heap:
+            d, u = heappop(heap)
+            if dist[u] != UNREACHABLE and dist[u] <= d:
+                continue
+            dist[u] = d
+            repaired.add(u)
+            for p in (u-1, u+1, u-width, u+width):
+                if heights[u] <= heights[p] + 1 and (dist[p] == UNREACHABLE or dist[p] > d+1):
+                    heappush(heap, (d+1, p))
+        return len(repaired)
 
-        # first hit is shortest path cuz of bfs
-        if pos == end:
-            return steps
 
-        # seen check moved down and initialized with starts
+def solve(data: str) -> tuple[int | float, int | float]:
+    hm = parse(data)
+    dist = distances_to_end(hm)
+    starts = [i for i, height in enumerate(hm.heights) if height == ord("a")]
+    return (shortest(dist, [hm.start]), shortest(dist, starts))
 
-        for d in (1, -1, 1j, -1j):
-            new_pos = pos + d
-            if new_pos in graph and graph[new_pos] <= graph[pos] + 1:
-                # when seen, we already came here with less steps cuz of bfs
-                # seen check here to keep queue short
-                if new_pos not in seen:
-                    seen.add(new_pos)
-                    q.append((new_pos, steps+1))
-    return inf
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--query", nargs=2, type=int, action="append", metavar=("X", "Y"),
+                        help="steps from cell X,Y to the end, repeatable")
+    args = parser.parse_args()
 
-data = open(input_path).read()
-graph, start, end = build_graph(data)
-print("Part 1:", bfs(graph, [start], end))
+    hm = parse(open(input_path).read())
+    dist = distances_to_end(hm)
+    starts = [i for i, height in enumerate(hm.heights) if height == ord("a")]
+    print("Part 1:", shortest(dist, [hm.start]))
+    print("Part 2:", shortest(dist, starts))
 
-starts = [pos for pos, height in graph.items() if height == ord("a")]
-print("Part 2:", bfs(graph, starts, end))
+    for x, y in args.query or []:
+        try:
+            cell = hm.index(x, y)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"Steps from {x},{y}:", shortest(dist, [cell]))
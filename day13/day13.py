@@ -1,11 +1,16 @@
+import argparse
 import os.path
-from functools import cmp_to_key
+from bisect import bisect_left
 from math import prod
+from typing import Iterable, Iterator
+
+from aoc.inputs import iter_lines
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
 
-data = open(input_path).read()
+DIVIDERS = [[[2]], [[6]]]
+_END = object()
 
 
 def in_order(left: list | int, right: list | int) -> int:
@@ -29,15 +34,122 @@ def in_order(left: list | int, right: list | int) -> int:
     return in_order(len(left), len(right))
 
 
-ans = 0
-for i, line in enumerate(data.split("\n\n"), 1):
-    left, right = line.splitlines()
-    res = in_order(eval(left), eval(right))
-    if res == -1:
-        ans += i
-print("Part 1:", ans)
+def sort_key(packet: list) -> tuple[int, ...]:
+    '''
+    flat tuple of ints whose natural ordering is in_order: sorted(packets, key=sort_key) needs no cmp_to_key
+    every leaf (int or empty list) in walk order adds three ints:
+      1, value     for an int: an int equals the int wrapped in any number of lists, so its depth is left out
+      0, depth     for an empty list: it is smaller than any int, and smaller the closer it is to the root
+      depth        lists still open after the leaf (0 after the last one): closing more lists before
+                   the next element is like running out of elements first, smaller
+    the key does not depend on the other packets, so keys can be cached and compared across sorts
+    '''
+    key: list[int] = []
+    stack = [iter(packet)]
+    fresh = True  # the list on top of the stack has no elements so far
+    closed = False  # a leaf was added, its depth entry is still missing
+    while stack:
+        item = next(stack[-1], _END)
+        if item is _END:
+            if fresh:
+                key += (0, len(stack))
+                closed = True
+            stack.pop()
+            fresh = False
+            continue
+        if closed:
+            key.append(len(stack))
+            closed = False
+        if isinstance(item, list):
+            stack.append(iter(item))
+            fresh = True
+        else:
+            key += (1, item)
+            closed = True
+            fresh = False
+    key.append(0)
+    return tuple(key)
+
+
+def parse_packet(line: str) -> list:
+    # no eval and no recursion, any depth: "[1,[]]" -> "[", "1", "[", "", "]", "", "]" tokens
+    root: list = []
+    stack = [root]
+    curr = root
+    tokens = line.replace("[", "[,").replace("]", ",]").split(",")
+    for i, token in enumerate(tokens):
+        if token == "[":
+            packet: list = []
+            curr.append(packet)
+            stack.append(packet)
+            curr = packet
+        elif token == "]":
+            stack.pop()
+            if not stack:
+                raise ValueError(f"unbalanced packet: {line!r}")
+            curr = stack[-1]
+        elif token:
+            curr.append(int(token))
+        elif tokens[i-1:i+2:2] != ["[", "]"]:
+            # the split leaves an empty token only between the brackets of an empty list
+            raise ValueError(f"empty element in packet: {line!r}")
+    if len(stack) != 1 or len(root) != 1 or not isinstance(root[0], list):
+        raise ValueError(f"not a packet: {line!r}")
+    return root[0]
+
+
+def packets(lines: Iterable[str]) -> Iterator[list]:
+    # every line parsed once, blank lines between the pairs skipped
+    for line in lines:
+        if line:
+            yield parse_packet(line)
+
+
+def divider_positions(all_packets: Iterable[list], dividers: list[list] = DIVIDERS) -> list[int]:
+    '''
+    1-based position of every divider in sorted(all_packets + dividers), without sorting the packets:
+    one pass that places every packet among the sorted dividers with a binary search,
+    O(n log k) tuple comparisons for k dividers, ties end up where the stable sort puts them
+    '''
+    order = sorted(range(len(dividers)), key=lambda i: sort_key(dividers[i]))
+    ranked = [sort_key(dividers[i]) for i in order]
+    placed = [0]*(len(dividers)+1)  # placed[j]: packets between ranked divider j-1 and j
+    for packet in all_packets:
+        placed[bisect_left(ranked, sort_key(packet))] += 1
+
+    positions = [0]*len(dividers)
+    before = 0
+    for j, i in enumerate(order):
+        before += placed[j]
+        positions[i] = before + j + 1
+    return positions
+
+
+def solve_packets(all_packets: list[list]) -> tuple[int, int]:
+    ans = 0
+    for i, (left, right) in enumerate(zip(all_packets[::2], all_packets[1::2]), 1):
+        if in_order(left, right) == -1:
+            ans += i
+
+    return (ans, prod(divider_positions(all_packets)))
+
+
+def solve(data: str) -> tuple[int, int]:
+    return solve_packets(list(packets(data.splitlines())))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--divider", action="append", metavar="PACKET",
+                        help="position of more divider packets, e.g. [[4]], repeatable")
+    args = parser.parse_args()
+
+    all_packets = list(packets(iter_lines(input_path)))
+    p1, p2 = solve_packets(all_packets)
+    print("Part 1:", p1)
+    print("Part 2:", p2)
 
-divider = [[[2]], [[6]]]
-all_packets = [eval(p) for p in data.replace("\n\n", "\n").splitlines()] + divider
-all_packets = sorted(all_packets, key=cmp_to_key(in_order))
-print("Part 2:", prod(all_packets.index(d)+1 for d in divider))
+    if args.divider:
+        dividers = DIVIDERS + [parse_packet(d) for d in args.divider]
+        for d, pos in zip(args.divider, divider_positions(all_packets, dividers)[len(DIVIDERS):]):
+            print(f"Divider {d}:", pos)
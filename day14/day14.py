@@ -0,0 +1,135 @@
+import argparse
+import os.path
+from dataclasses import dataclass
+from itertools import pairwise
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+input_path = os.path.join(dir_path, "input.txt")
+
+EMPTY, ROCK, SAND = 0, 1, 2
+HOLE = (500, 0)
+
+
+@dataclass(slots=True)
+class Cave:
+    # dense uint8 grid, flat and row by row, from row 0 down to the floor row two below the lowest rock.
+    # wide enough for the whole sand triangle under the hole plus one column on each side,
+    # so neighbours never need a bounds check
+    cells: bytearray
+    width: int
+    x0: int  # x of column 0
+    floor: bool  # the floor row is rock, else it is the void
+
+    @property
+    def height(self) -> int:
+        return len(self.cells) // self.width
+
+    @property
+    def hole(self) -> int:
+        return HOLE[1]*self.width + HOLE[0] - self.x0
+
+
+def parse(data: str, floor: bool) -> Cave:
+    paths = [[tuple(map(int, p.split(","))) for p in line.split(" -> ")] for line in data.splitlines() if line]
+    xs = [x for path in paths for x, y in path]
+    floor_y = max(y for path in paths for x, y in path) + 2
+    x0 = min(min(xs), HOLE[0] - floor_y)
+    width = max(max(xs), HOLE[0] + floor_y) - x0 + 1
+
+    cells = bytearray(width*(floor_y+1))
+    for path in paths:
+        for (x1, y1), (x2, y2) in pairwise(path):
+            (x1, x2), (y1, y2) = sorted((x1, x2)), sorted((y1, y2))
+            start = y1*width + x1-x0
+            if y1 == y2:
+                cells[start:start + x2-x1+1] = bytes([ROCK])*(x2-x1+1)
+            else:
+                cells[start:start + (y2-y1)*width+1:width] = bytes([ROCK])*(y2-y1+1)
+    if floor:
+        cells[floor_y*width:] = bytes([ROCK])*width
+    return Cave(cells, width, x0, floor)
+
+
+def pour(cave: Cave) -> int:
+    '''
+    number of grains that come to rest
+    path holds the cells the last grain fell through: the next grain follows the same way
+    until the cell the last one settled in, so it starts from the cell above that instead of from the hole
+    every cell is pushed and popped at most once, O(grains) in total
+    '''
+    cells, width = cave.cells, cave.width
+    bottom = len(cells) - width  # first cell of the floor row
+    path = [cave.hole]
+    grains = 0
+    while path:
+        i = path[-1]
+        below = i + width
+        for j in (below, below-1, below+1):
+            if not cells[j]:
+                if j >= bottom:  # only without a floor, the rest falls into the void the same way
+                    return grains
+                path.append(j)
+                break
+        else:  # nowhere to go
+            cells[i] = SAND
+            path.pop()
+            grains += 1
+    return grains  # the hole is blocked
+
+
+def fill(cave: Cave) -> int:
+    '''
+    same as pour with a floor, without dropping a single grain:
+    the sand ends up in every cell that can be reached from the hole falling down or diagonally down,
+    so the sand of a row is the sand of the row above widened by one to both sides, minus the rock.
+    one vectorized step per row, O(area)
+    '''
+    import numpy as np
+
+    if not cave.floor:
+        raise ValueError("fill needs a cave with a floor, use pour")
+    grid = np.frombuffer(cave.cells, dtype=np.uint8).reshape(cave.height, cave.width)
+    free = grid == EMPTY
+    sand = np.zeros(cave.width, dtype=bool)
+    sand[HOLE[0] - cave.x0] = free[HOLE[1], HOLE[0] - cave.x0]
+    grains = 0
+    for y in range(HOLE[1], cave.height-1):
+        if y > HOLE[1]:
+            # the triangle never reaches the first and last column
+            sand[1:-1] = (sand[:-2] | sand[1:-1] | sand[2:]) & free[y, 1:-1]
+        grid[y, sand] = SAND
+        grains += int(np.count_nonzero(sand))
+    return grains
+
+
+def plot(cave: Cave) -> None:
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    grid = np.frombuffer(cave.cells, dtype=np.uint8).reshape(cave.height, cave.width)
+    cols = np.flatnonzero(grid[:-1].any(axis=0))
+    X = np.where(grid == EMPTY, np.nan, grid.astype(float))[:, cols[0]:cols[-1]+1]
+    if not cave.floor:
+        X = X[:-1]
+    X[HOLE[1], HOLE[0] - cave.x0 - cols[0]] = 3
+
+    plt.imshow(X, cmap="tab20b")
+    plt.show()
+
+
+def solve(data: str) -> tuple[int, int]:
+    return (pour(parse(data, floor=False)), fill(parse(data, floor=True)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--plot", action="store_true", help="show the cave of part 2")
+    parser.add_argument("--drop", action="store_true", help="drop every grain of part 2 instead of filling row by row")
+    args = parser.parse_args()
+
+    data = open(input_path).read()
+    print("Part 1:", pour(parse(data, floor=False)))
+    cave = parse(data, floor=True)
+    print("Part 2:", pour(cave) if args.drop else fill(cave))
+    if args.plot:
+        plot(cave)
@@ -67,6 +67,11 @@ def create_cave(data: str) -> Cave:
     return Cave(grid)
 
 
-cave = create_cave(open(input_path).read())
-print("Part 1:", cave.max_drops())
-cave.plot()
+def solve(data: str) -> tuple[int, None]:
+    return (create_cave(data).max_drops(), None)
+
+
+if __name__ == "__main__":
+    cave = create_cave(open(input_path).read())
+    print("Part 1:", cave.max_drops())
+    cave.plot()
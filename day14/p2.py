@@ -73,6 +73,11 @@ def create_cave(data: str) -> Cave:
     return Cave(grid)
 
 
-cave = create_cave(open(input_path).read())
-print("Part 2:", cave.max_drops())
-cave.plot()
+def solve(data: str) -> tuple[None, int]:
+    return (None, create_cave(data).max_drops())
+
+
+if __name__ == "__main__":
+    cave = create_cave(open(input_path).read())
+    print("Part 2:", cave.max_drops())
+    cave.plot()
@@ -1,47 +1,92 @@
 import os.path
 import re
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import shapely
-from shapely.geometry import Polygon, mapping
 from itertools import combinations
-from shapely import prepare
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:  # shapely and matplotlib are imported where needed, they dominate the startup time
+    from shapely.geometry import Polygon
+
+type Sensor = tuple[int, int, int]  # (sx,sy,dist)
+type Point = tuple[float, float]
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
 
-with open(input_path) as f:
-    data = f.read().splitlines()
-
 regex = re.compile(r"-?\d+")
-plt.figure(0)
-polygons = []
-for line in data:
-    sx, sy, bx, by = map(int, regex.findall(line))
-    dist = abs(sx-bx) + abs(sy-by)  # manhatten
-    a = (sx+dist, sy)
-    b = (sx, sy+dist)
-    c = (sx-dist, sy)
-    d = (sx, sy-dist)
-    polygon = (a, b, c, d)
-    poly = Polygon(polygon)
-    prepare(poly)
-    polygons.append(Polygon(polygon))
-    # ax.add_patch(mpatches.Polygon(polygon))
-    plt.plot((sx+dist, sx, sx-dist, sx, sx+dist), (sy, sy+dist, sy, sy-dist, sy))
-
-intersections = set()
-for s1, s2 in combinations(polygons, 2):
-    inter = shapely.intersection(s1, s2)
-    if inter and inter.geom_type == "Polygon":
-        intersections.update(inter.exterior.coords)
-
-inter = list(intersections)
-
-plt.xlim(0, 4000000)
-plt.ylim(0, 4000000)
-
-plt.figure(1)
-plt.scatter([x for x, y in inter], [y for x, y in inter])
-plt.show()
+
+
+def create_sensors(data: str) -> list[Sensor]:
+    sensors = []
+    for line in data.splitlines():
+        sx, sy, bx, by = map(int, regex.findall(line))
+        dist = abs(sx-bx) + abs(sy-by)  # manhatten
+        sensors.append((sx, sy, dist))
+    return sensors
+
+
+def create_polygons(sensors: list[Sensor]) -> list["Polygon"]:
+    from shapely import prepare
+    from shapely.geometry import Polygon
+
+    polygons = []
+    for sx, sy, dist in sensors:
+        a = (sx+dist, sy)
+        b = (sx, sy+dist)
+        c = (sx-dist, sy)
+        d = (sx, sy-dist)
+        polygon = (a, b, c, d)
+        poly = Polygon(polygon)
+        prepare(poly)
+        polygons.append(Polygon(polygon))
+        # ax.add_patch(mpatches.Polygon(polygon))
+    return polygons
+
+
+def intersection_points(polygons: list["Polygon"]) -> list[Point]:
+    import shapely
+
+    intersections = set()
+    for s1, s2 in combinations(polygons, 2):
+        inter = shapely.intersection(s1, s2)
+        if inter and inter.geom_type == "Polygon":
+            intersections.update(inter.exterior.coords)
+    return list(intersections)
+
+
+def tuning_frequency(sensors: list[Sensor], candidates: list[Point], limit: int = 4_000_000) -> int:
+    # the beacon is the one cell no sensor covers, right next to where the borders of two sensors cross
+    for x, y in candidates:
+        for bx in range(int(x)-2, int(x)+3):
+            for by in range(int(y)-2, int(y)+3):
+                if (0 <= bx <= limit and 0 <= by <= limit
+                        and all(abs(sx-bx) + abs(sy-by) > dist for sx, sy, dist in sensors)):
+                    return 4000000 * bx + by
+    raise ValueError("no uncovered cell next to the candidates")
+
+
+def solve(data: str, limit: int = 4_000_000) -> tuple[None, int]:
+    sensors = create_sensors(data)
+    return (None, tuning_frequency(sensors, intersection_points(create_polygons(sensors)), limit))
+
+
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    with open(input_path) as f:
+        data = f.read()
+
+    sensors = create_sensors(data)
+    plt.figure(0)
+    for sx, sy, dist in sensors:
+        plt.plot((sx+dist, sx, sx-dist, sx, sx+dist), (sy, sy+dist, sy, sy-dist, sy))
+
+    inter = intersection_points(create_polygons(sensors))
+    print("Candidates:", len(inter))
+    print("Part 2:", tuning_frequency(sensors, inter))
+
+    plt.xlim(0, 4000000)
+    plt.ylim(0, 4000000)
+
+    plt.figure(1)
+    plt.scatter([x for x, y in inter], [y for x, y in inter])
+    plt.show()
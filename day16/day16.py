@@ -149,17 +149,23 @@ def max_pressure(graph: Graph, shortest_paths: Weights, flow: FlowRates, start:
     return best
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
-
-graph, weights, flow = create_graph(data)
-simpflify_graph(graph, weights, flow, "AA")
-shortest_paths = floyd_warshall(graph, weights)
-p1 = max_pressure(graph, shortest_paths, flow, (30, ["AA"]))
-print("Part 1:", p1)
-p2 = max_pressure(graph, shortest_paths, flow, (26, ["AA"]), True)
-print("Part 2:", p2)
-
-# plot_graph(graph, weights)
+def solve(data: str) -> tuple[int, int]:
+    graph, weights, flow = create_graph(data)
+    simpflify_graph(graph, weights, flow, "AA")
+    shortest_paths = floyd_warshall(graph, weights)
+    p1 = max_pressure(graph, shortest_paths, flow, (30, ["AA"]))
+    p2 = max_pressure(graph, shortest_paths, flow, (26, ["AA"]), True)
+    return (p1, p2)
+
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
+
+    p1, p2 = solve(data)
+    print("Part 1:", p1)
+    print("Part 2:", p2)
+
+    # plot_graph(*create_graph(data)[:2])
@@ -65,19 +65,26 @@ def calc_all_pressures(flow: FlowRates, weights: Weights, limit: int, start: Nod
     return all_pressures
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
-
-graph, weights, flow = create_graph(data)
-# no need to simplify graph:
-# floyd warshall + non zero flow dict is sufficient
-floyd_warshall(graph, weights)
-all_flows = calc_all_pressures(flow, weights, 30, "AA")
-print("Part 1:", max(f for f in all_flows.values()))
-
-all_flows = calc_all_pressures(flow, weights, 26, "AA")
-# combine 2 disjoint paths
-p2 = max(f1+f2 for (mask1, f1), (mask2, f2) in combinations(all_flows.items(), 2) if not mask1 & mask2)
-print("Part 2:", p2)
+def solve(data: str) -> tuple[int, int]:
+    graph, weights, flow = create_graph(data)
+    # no need to simplify graph:
+    # floyd warshall + non zero flow dict is sufficient
+    floyd_warshall(graph, weights)
+    all_flows = calc_all_pressures(flow, weights, 30, "AA")
+    p1 = max(f for f in all_flows.values())
+
+    all_flows = calc_all_pressures(flow, weights, 26, "AA")
+    # combine 2 disjoint paths
+    p2 = max(f1+f2 for (mask1, f1), (mask2, f2) in combinations(all_flows.items(), 2) if not mask1 & mask2)
+    return (p1, p2)
+
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
+
+    p1, p2 = solve(data)
+    print("Part 1:", p1)
+    print("Part 2:", p2)
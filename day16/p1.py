@@ -116,7 +116,7 @@ def max_pressure(graph: Graph, weights: Weights, flow: FlowRates, starts: list[P
 
         if node not in opened:
             new_opened = opened | {node}  # open the valve
-            new_p = p + (m-1)*flow_rates[node]
+            new_p = p + (m-1)*flow[node]
             best = max(best, new_p)  # we might have a new best
             if len(new_opened) != len(graph):  # skip if last valve
                 # estimate if candidate can ever get better - TODO: necessary here?
@@ -135,14 +135,19 @@ def max_pressure(graph: Graph, weights: Weights, flow: FlowRates, starts: list[P
     return best
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+def solve(data: str) -> tuple[int, None]:
+    graph, weights, flow_rates = create_graph(data)
+    starts = simpflify_graph(graph, weights, flow_rates, "AA", 30)
+    return (max_pressure(graph, weights, flow_rates, starts), None)
 
-graph, weights, flow_rates = create_graph(data)
-starts = simpflify_graph(graph, weights, flow_rates, "AA", 30)
-ans = max_pressure(graph, weights, flow_rates, starts)
-print("Part 1:", ans)
 
-# plot_graph(graph, weights)
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
+
+    p1, _ = solve(data)
+    print("Part 1:", p1)
+
+    # plot_graph(*create_graph(data)[:2])
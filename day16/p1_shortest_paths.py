@@ -150,18 +150,22 @@ def max_pressure(graph: Graph, shortest_paths: Weights, flow: FlowRates, starts:
             i += 1
             heappush(q, (-new_p, i, (m-w-1, new_p, new_opened)))
 
-    print(i)
     return best
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+def solve(data: str) -> tuple[int, None]:
+    graph, weights, flow_rates = create_graph(data)
+    starts = simpflify_graph(graph, weights, flow_rates, "AA", 30)
+    shortest_paths = floyd_warshall(graph, weights)
+    return (max_pressure(graph, shortest_paths, flow_rates, starts), None)
 
-graph, weights, flow_rates = create_graph(data)
-starts = simpflify_graph(graph, weights, flow_rates, "AA", 30)
-shortest_paths = floyd_warshall(graph, weights)
-ans = max_pressure(graph, shortest_paths, flow_rates, starts)
-print("Part 1:", ans)
-# plot_graph(graph, weights)
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
+
+    p1, _ = solve(data)
+    print("Part 1:", p1)
+    # plot_graph(*create_graph(data)[:2])
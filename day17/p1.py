@@ -105,11 +105,6 @@ class Tetris:
         plt.show()
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
-
 hor = inspect.cleandoc("""
     ....
     ....
@@ -138,6 +133,18 @@ square = inspect.cleandoc("""
 
 h, c, l = Piece("hor", 4, 4, hor), Piece("cross", 4, 4, cross), Piece("l", 4, 4, el)
 v, s = Piece("vert", 4, 4, vert), Piece("square", 4, 4, square)
-game = Tetris([h, c, l, v, s], data)
-ans = game.play(2022, False)
-print("Part 1:", ans)
+
+
+def solve(data: str) -> tuple[int, None]:
+    game = Tetris([h, c, l, v, s], data)
+    return (game.play(2022, False), None)
+
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
+
+    p1, _ = solve(data)
+    print("Part 1:", p1)
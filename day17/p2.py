@@ -106,11 +106,6 @@ class Tetris:
         return any((p[0]+pos[0], p[1]+pos[1]) in self.occupied for p in piece.pixel)
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
-
 hor = inspect.cleandoc("""
     ....
     ....
@@ -139,17 +134,30 @@ square = inspect.cleandoc("""
 
 h, c, l = Piece("hor", 4, 4, hor), Piece("cross", 4, 4, cross), Piece("l", 4, 4, el)
 v, s = Piece("vert", 4, 4, vert), Piece("square", 4, 4, square)
-game = Tetris([h, c, l, v, s], data)
-
-# game.find_period()
-
-# after examination of find_period() output:
-# we get a periodically full top row (#######)
-# period starts after 441 drops with a length of 1700
-until_period = game.play(441)
-period_height = game.play(1700) - until_period
-periods_to_play = (1000000000000 - 441) // 1700
-remaining = (1000000000000 - 441) % 1700
-remaining_height = game.play(remaining)
-ans = remaining_height + (periods_to_play-1)*period_height  # 1 period already played
-print("Part 2:", ans)
+
+
+def solve(data: str) -> tuple[None, int]:
+    game = Tetris([h, c, l, v, s], data)
+
+    # game.find_period()
+
+    # after examination of find_period() output:
+    # we get a periodically full top row (#######)
+    # period starts after 441 drops with a length of 1700
+    until_period = game.play(441)
+    period_height = game.play(1700) - until_period
+    periods_to_play = (1000000000000 - 441) // 1700
+    remaining = (1000000000000 - 441) % 1700
+    remaining_height = game.play(remaining)
+    ans = remaining_height + (periods_to_play-1)*period_height  # 1 period already played
+    return (None, ans)
+
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
+
+    _, p2 = solve(data)
+    print("Part 2:", p2)
@@ -101,12 +101,18 @@ class Droplet:
         return all(self.bounds_min[i] <= coord[i] <= self.bounds_max[i] for i in range(3))
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
-
-droplet = Droplet(data)
-print("Part 1:", droplet.surface)
-print("Part 2 (find holes):", droplet.surface - droplet.surface_interior)
-print("Part 2 (flood fill outside):", droplet.flood_from_outside())
+def solve(data: str) -> tuple[int, int]:
+    droplet = Droplet(data)
+    return (droplet.surface, droplet.flood_from_outside())
+
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
+
+    droplet = Droplet(data)
+    print("Part 1:", droplet.surface)
+    print("Part 2 (find holes):", droplet.surface - droplet.surface_interior)
+    print("Part 2 (flood fill outside):", droplet.flood_from_outside())
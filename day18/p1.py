@@ -16,10 +16,15 @@ def surface(data: str) -> int:
     return res
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+def solve(data: str) -> tuple[int, None]:
+    return (surface(data), None)
 
-ans = surface(data)
-print("Part 1:", ans)
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
+
+    p1, _ = solve(data)
+    print("Part 1:", p1)
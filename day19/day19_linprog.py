@@ -2,7 +2,6 @@ import os.path
 import re
 import numpy as np
 from numpy.typing import NDArray
-from scipy.optimize import linprog
 from math import prod
 from timeit import default_timer as timer
 
@@ -137,7 +136,9 @@ def objective(size: int) -> NDArray:
     return np.concatenate((a, b))
 
 
-def solve(input: NDArray, minutes: int) -> int:
+def solve_blueprint(input: NDArray, minutes: int) -> int:
+    from scipy.optimize import linprog  # half a second of imports, only pay when solving
+
     T = minutes
     A = np.zeros((3*T, 4*T))
     for j, row in enumerate(input):
@@ -163,16 +164,24 @@ def solve(input: NDArray, minutes: int) -> int:
     return -round(res.fun)
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+def solve(data: str) -> tuple[int, int]:
+    blueprints = parse_input(data)
+    p1 = sum(i*solve_blueprint(blueprint, 24) for i, blueprint in enumerate(blueprints, 1))
+    p2 = prod(solve_blueprint(blueprint, 32) for blueprint in blueprints[:3])
+    return (p1, p2)
+
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
 
-start = timer()
+    start = timer()
 
-blueprints = parse_input(data)
-print("Part 1:", sum(i*solve(blueprint, 24) for i, blueprint in enumerate(blueprints, 1)))
-print("Part 2:", prod(solve(blueprint, 32) for blueprint in blueprints[:3]))
+    p1, p2 = solve(data)
+    print("Part 1:", p1)
+    print("Part 2:", p2)
 
-end = timer()
-print("time:", end - start)
+    end = timer()
+    print("time:", end - start)
@@ -1,7 +1,6 @@
 import os.path
 import re
 from timeit import default_timer as timer
-from z3 import IntVector, Sum, Optimize
 from math import prod
 from itertools import chain
 
@@ -27,22 +26,24 @@ def parse_input(data: str) -> list[list[int]]:
     return res
 
 
-def objective(x, T: int):
+def objective(Sum, x, T: int):
     return Sum((T-k-1)*x[k] for k in range(T-1))
 
 
-def cost(X, robot_costs, r: int, t: int):
+def cost(Sum, X, robot_costs, r: int, t: int):
     return Sum(robot_costs[r][k] * X[k][t-1]for k in range(4))
 
 
-def ineq_m_r_i(X, robot_costs, r_start: int, r: int, t: int, T: int):
+def ineq_m_r_i(Sum, X, robot_costs, r_start: int, r: int, t: int, T: int):
     s1 = r_start*t  # starting robots gain
     s2 = Sum((t-k)*X[r][k-1] for k in range(1, t))  # built robots gain
-    s3 = Sum(cost(X, robot_costs, r, k) for k in range(1, t+2) if k <= T)  # costs
+    s3 = Sum(cost(Sum, X, robot_costs, r, k) for k in range(1, t+2) if k <= T)  # costs
     return s1+s2-s3 >= 0
 
 
 def create_model(T: int, robot_costs):
+    # z3 is imported once per model and its Sum handed to the expression builders, importing this module stays cheap
+    from z3 import IntVector, Optimize, Sum
 
     R = [0, 1, 2]  # robot indices
     R_start = [1, 0, 0]  # starting robots
@@ -53,7 +54,7 @@ def create_model(T: int, robot_costs):
     # m_r_i
     for t in range(1, T+1):
         for r, r_start in zip(R, R_start):
-            s.add(ineq_m_r_i(X, robot_costs, r_start, r, t, T))
+            s.add(ineq_m_r_i(Sum, X, robot_costs, r_start, r, t, T))
 
     # f_i
     for t in range(T):
@@ -67,7 +68,7 @@ def create_model(T: int, robot_costs):
             s.add(x_r_i <= 1)
 
     # objective
-    c = objective(X[-1], T)
+    c = objective(Sum, X[-1], T)
     s.maximize(c)
 
     return s
@@ -89,22 +90,30 @@ def solve_with_z3(s, blue, robot_costs) -> int:
     return res
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+def solve(data: str) -> tuple[int, int]:
+    from z3 import IntVector
 
-start = timer()
+    blueprints = parse_input(data)  # actual robot costs
+    RC = [IntVector('c%s' % i, 4) for i in "ABC"]  # 3x4 robot cost variables
+    model = create_model(24, RC)
+    model2 = create_model(32, RC)
 
-blueprints = parse_input(data)  # actual robot costs
-RC = [IntVector('c%s' % i, 4) for i in "ABC"]  # 3x4 robot cost variables
-model = create_model(24, RC)
-model2 = create_model(32, RC)
+    p1 = sum(i*solve_with_z3(model, blue, RC) for i, blue in enumerate(blueprints, 1))
+    p2 = prod(solve_with_z3(model2, blue, RC) for blue in blueprints[:3])
+    return (p1, p2)
 
-blueprints = parse_input(data)
-print("Part 1:", sum(i*solve_with_z3(model, blue, RC) for i, blue in enumerate(blueprints, 1)))
-print("Part 2:", prod(solve_with_z3(model2, blue, RC) for blue in blueprints[:3]))
 
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
 
-end = timer()
-print("time:", end - start)
+    start = timer()
+
+    p1, p2 = solve(data)
+    print("Part 1:", p1)
+    print("Part 2:", p2)
+
+    end = timer()
+    print("time:", end - start)
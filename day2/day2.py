@@ -1,10 +1,13 @@
+import argparse
 import os.path
+from collections import Counter
+from typing import Iterable
+
+from aoc.inputs import byte_array, iter_lines, mapped
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
 
-data = open(input_path).read().splitlines()
-
 POINTS = {"A": 1, "B": 2, "C": 3, "X": 1, "Y": 2, "Z": 3}
 OUTCOME = {"X": 0, "Y": 3, "Z": 6}
 LOOSES_AGAINST = {"A": "B", "B": "C", "C": "A"}
@@ -39,12 +42,62 @@ def choose(opponent, outcome) -> str:
     return LOOSES_AGAINST[opponent]
 
 
-p1, p2 = 0, 0
-for game in data:
-    opponent, me = game.split(" ")
-    p1 += POINTS[me] + outcome(opponent, me)
-    p2 += POINTS[choose(opponent, me)] + OUTCOME[me]
+def score_tables() -> tuple[list[int], list[int]]:
+    # score of all 9 rounds for both parts, index 3*opponent + me (A/X = 0, B/Y = 1, C/Z = 2)
+    p1, p2 = [], []
+    for opponent in "ABC":
+        for me in "XYZ":
+            p1.append(POINTS[me] + outcome(opponent, me))
+            p2.append(POINTS[choose(opponent, me)] + OUTCOME[me])
+    return (p1, p2)
+
+
+SCORE_P1, SCORE_P2 = score_tables()
+ROUNDS = [f"{opponent} {me}" for opponent in "ABC" for me in "XYZ"]  # same order as the tables
+SCORES = {game: (SCORE_P1[i], SCORE_P2[i]) for i, game in enumerate(ROUNDS)}
+
+
+def score(lines: Iterable[str]) -> tuple[int, int]:
+    # only 9 different lines: count them in C, then score each kind once
+    p1, p2 = 0, 0
+    for game, n in Counter(lines).items():
+        s1, s2 = SCORES[game]
+        p1 += n*s1
+        p2 += n*s2
+    return (p1, p2)
+
+
+def solve(data: str) -> tuple[int, int]:
+    return score(data.splitlines())
+
+
+def solve_numpy(data: str | bytes) -> tuple[int, int]:
+    # every round is exactly 4 bytes "A X\n": reshape the raw input, no per line work at all
+    import numpy as np
+
+    buf = byte_array(data)
+    rounds = buf.reshape(-1, 4) if len(buf) % 4 == 0 else None
+    if rounds is None or not (
+        (rounds[:, 1] == ord(" ")).all() and (rounds[:, 3] == ord("\n")).all()
+        and np.isin(rounds[:, 0], np.frombuffer(b"ABC", dtype=np.uint8)).all()
+        and np.isin(rounds[:, 2], np.frombuffer(b"XYZ", dtype=np.uint8)).all()
+    ):  # crlf, stray spaces, blank lines: not the fixed layout, the line parser copes
+        return solve(data if isinstance(data, str) else bytes(data).decode())
+    idx = 3*(rounds[:, 0] - ord("A")) + (rounds[:, 2] - ord("X"))
+    counts = np.bincount(idx, minlength=9)
+    return (int(counts @ SCORE_P1), int(counts @ SCORE_P2))
+
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", nargs="?", default=input_path, help="input file, - for stdin")
+    parser.add_argument("--numpy", action="store_true", help="score the raw bytes with numpy")
+    args = parser.parse_args()
 
-print("Part 1:", p1)
-print("Part 2:", p2)
+    if args.numpy:
+        with mapped(args.input) as m:
+            p1, p2 = solve_numpy(m)
+    else:
+        p1, p2 = score(iter_lines(args.input))
+    print("Part 1:", p1)
+    print("Part 2:", p2)
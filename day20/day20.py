@@ -89,21 +89,26 @@ def grove_coordinates(linked_list: list[Node], zero: Node, runs: int = 1, key: i
     return sum(res)
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
+def solve(data: str) -> tuple[int, int]:
+    linked_list, zero = create_linked_list(data, 1)
+    linked_list2, zero2 = create_linked_list(data, 811589153)
 
-start = timer()
+    p1 = grove_coordinates(linked_list, zero,)
+    p2 = grove_coordinates(linked_list2, zero2, 10, 811589153)
+    return (p1, p2)
 
-linked_list, zero = create_linked_list(data, 1)
-linked_list2, zero2 = create_linked_list(data, 811589153)
 
-p1 = grove_coordinates(linked_list, zero,)
-p2 = grove_coordinates(linked_list2, zero2, 10, 811589153)
-print("Part 1:", p1)
-print("Part 2:", p2)
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
 
+    start = timer()
 
-end = timer()
-print("time:", end - start)
+    p1, p2 = solve(data)
+    print("Part 1:", p1)
+    print("Part 2:", p2)
+
+    end = timer()
+    print("time:", end - start)
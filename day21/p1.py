@@ -4,23 +4,29 @@ from operator import add, sub, mul, truediv
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
 
-data = open(input_path).read().splitlines()
+OP = {'+': add, '-': sub, '*': mul, '/': truediv}
 
-monkeys: dict[str, str] = {}
-for line in data:
-    m, job = line.split(': ')
-    monkeys[m] = job
 
-OP = {'+': add, '-': sub, '*': mul, '/': truediv}
+def create_monkeys(data: str) -> dict[str, str]:
+    monkeys: dict[str, str] = {}
+    for line in data.splitlines():
+        m, job = line.split(': ')
+        monkeys[m] = job
+    return monkeys
 
 
-def yell(m: str) -> float:
+def yell(monkeys: dict[str, str], m: str) -> float:
     job = monkeys[m]
     if job.isdigit():
         return int(job)
     ml, op, mr = job.split(' ')
-    return OP[op](yell(ml), yell(mr))
+    return OP[op](yell(monkeys, ml), yell(monkeys, mr))
+
+
+def solve(data: str) -> tuple[int, None]:
+    return (int(yell(create_monkeys(data), 'root')), None)
 
 
-ans = yell('root')
-print("Part 1:", int(ans))
+if __name__ == "__main__":
+    p1, _ = solve(open(input_path).read())
+    print("Part 1:", p1)
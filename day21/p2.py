@@ -4,59 +4,67 @@ from operator import add, sub, mul, truediv
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
 
-data = open(input_path).read().splitlines()
-
-monkeys: dict[str, str] = {}
-for line in data:
-    m, job = line.split(': ')
-    monkeys[m] = job
-
 OP = {'+': add, '-': sub, '*': mul, '/': truediv}
 INV = {'-': add, '+': sub, '/': mul, '*': truediv}
 
 
-def find_path(root: str, target: str) -> list[str]:
+def create_monkeys(data: str) -> dict[str, str]:
+    monkeys: dict[str, str] = {}
+    for line in data.splitlines():
+        m, job = line.split(': ')
+        monkeys[m] = job
+    return monkeys
+
+
+def find_path(monkeys: dict[str, str], root: str, target: str) -> list[str]:
     if root == target:
         return [root]
     job = monkeys[root]
     if job.isdigit():
         return []
     ml, op, mr = job.split(' ')
-    res = find_path(ml, target)
+    res = find_path(monkeys, ml, target)
     if res:
         return [root] + res
-    res = find_path(mr, target)
+    res = find_path(monkeys, mr, target)
     if res:
         return [root] + res
     return []
 
 
-def yell(m: str) -> float:
+def yell(monkeys: dict[str, str], m: str) -> float:
     job = monkeys[m]
     if job.isdigit():
         return int(job)
     ml, op, mr = job.split(' ')
-    return OP[op](yell(ml), yell(mr))
-
-
-print("Part 1:", yell('root'))
-
-# its a binary tree
-# find the path from root to humn
-# traverse that path and evaluate + invert (some) operations
-path = find_path('root', 'humn')
-humn = None
-for i, node in enumerate(path[1:]):
-    above = path[i]
-    job_above = monkeys[above]
-    ml, op, mr = job_above.split(' ')
-    val = yell(mr) if ml == node else yell(ml)
-    if humn is None:
-        humn = val
-        continue
-    if op in '+*' or ml == node:
-        humn = INV[op](humn, val)
-    else:
-        humn = OP[op](val, humn)
-
-print('Part2:', humn)
+    return OP[op](yell(monkeys, ml), yell(monkeys, mr))
+
+
+def solve(data: str) -> tuple[float, float | None]:
+    monkeys = create_monkeys(data)
+
+    # its a binary tree
+    # find the path from root to humn
+    # traverse that path and evaluate + invert (some) operations
+    path = find_path(monkeys, 'root', 'humn')
+    humn = None
+    for i, node in enumerate(path[1:]):
+        above = path[i]
+        job_above = monkeys[above]
+        ml, op, mr = job_above.split(' ')
+        val = yell(monkeys, mr) if ml == node else yell(monkeys, ml)
+        if humn is None:
+            humn = val
+            continue
+        if op in '+*' or ml == node:
+            humn = INV[op](humn, val)
+        else:
+            humn = OP[op](val, humn)
+
+    return (yell(monkeys, 'root'), humn)
+
+
+if __name__ == "__main__":
+    p1, p2 = solve(open(input_path).read())
+    print("Part 1:", p1)
+    print('Part2:', p2)
@@ -80,18 +80,22 @@ def follow(board: Board, path: str, start_pos: Pos, start_dir: Dir, dimy: int, d
     return password(pos, d)
 
 
-s = timer()
+def solve(data: str) -> tuple[int, None]:
+    board_raw, path = data.split("\n\n")
+    board, start, dimy, dimx = create_board(board_raw)
+    return (follow(board, path, start, 1, dimy, dimx), None)
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
 
-board_raw, path = data.split("\n\n")
-board, start, dimy, dimx = create_board(board_raw)
-pwd = follow(board, path, start, 1, dimy, dimx)
+if __name__ == "__main__":
+    s = timer()
 
-print("Part 1:", pwd)
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
 
-e = timer()
-print("time:", e - s)
+    p1, _ = solve(data)
+    print("Part 1:", p1)
+
+    e = timer()
+    print("time:", e - s)
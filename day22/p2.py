@@ -98,15 +98,10 @@ def follow(board: Board, path: str, start_pos: Pos, start_dir: Dir, dimy: int, d
     return password(pos, d)
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
-
-board_raw, path = data.split("\n\n")
-board, start, dimy, dimx = create_board(board_raw)
-pwd = follow(board, path, start, 1, dimy, dimx)
-print("Part 2:", pwd)
+def solve(data: str) -> tuple[None, int]:
+    board_raw, path = data.split("\n\n")
+    board, start, dimy, dimx = create_board(board_raw)
+    return (None, follow(board, path, start, 1, dimy, dimx))
 
 
 tests = [
@@ -128,3 +123,13 @@ tests = [
 
 # for desc, pos, d, exp in tests:
 #     switch_face(pos, d, exp)
+
+
+if __name__ == "__main__":
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
+
+    _, p2 = solve(data)
+    print("Part 2:", p2)
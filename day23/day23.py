@@ -86,21 +86,28 @@ def part1(elves: set[Pos]) -> int:
     return dimy*dimx-len(elves)
 
 
-s = timer()
+def solve(data: str) -> tuple[int, int]:
+    elves = {i + j*1j for j, row in enumerate(data.splitlines()) for i, c in enumerate(row) if c == "#"}
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read().splitlines()
+    after, rounds = spreadout(elves, 10)
+    p1 = part1(after)
 
-elves = {i + j*1j for j, row in enumerate(data) for i, c in enumerate(row) if c == "#"}
+    after, rounds = spreadout(elves)
+    # plot_elves(after)
+    return (p1, rounds)
 
-after, rounds = spreadout(elves, 10)
-print("Part 1:",  part1(after))
 
-after, rounds = spreadout(elves)
-print("Part 2:",  rounds)
-# plot_elves(after)
+if __name__ == "__main__":
+    s = timer()
 
-e = timer()
-print("time:", e - s)
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
+
+    p1, p2 = solve(data)
+    print("Part 1:",  p1)
+    print("Part 2:",  p2)
+
+    e = timer()
+    print("time:", e - s)
@@ -119,23 +119,28 @@ def expedition(valley: Valley, dimy: int, dimx: int) -> list[int]:
     return durations
 
 
-s = timer()
+def solve(data: str) -> tuple[int, int]:
+    valley, dimy, dimx = create_map(data)
+    durations = expedition(valley, dimy, dimx)
+    return (durations[0], sum(durations))
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-input_path = os.path.join(dir_path, "input.txt")
-with open(input_path) as f:
-    data = f.read()
 
-valley, dimy, dimx = create_map(data)
-durations = expedition(valley, dimy, dimx)
-print("Part 1:", durations[0])
-print("Part 2:", sum(durations))
+if __name__ == "__main__":
+    s = timer()
 
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    input_path = os.path.join(dir_path, "input.txt")
+    with open(input_path) as f:
+        data = f.read()
 
-e = timer()
-print("time:", e - s)
+    p1, p2 = solve(data)
+    print("Part 1:", p1)
+    print("Part 2:", p2)
 
+    e = timer()
+    print("time:", e - s)
 
-# debug stuff
-# after = blizzards_move(valley, dimy, dimx, 200)
-# print_valley(after, dimy, dimx)
+    # debug stuff
+    # valley, dimy, dimx = create_map(data)
+    # after = blizzards_move(valley, dimy, dimx, 200)
+    # print_valley(after, dimy, dimx)
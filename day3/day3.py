@@ -0,0 +1,74 @@
+import argparse
+import os.path
+from itertools import batched
+from string import ascii_letters
+from typing import Iterable
+
+from aoc.inputs import byte_array, iter_lines, line_bounds, mapped
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+input_path = os.path.join(dir_path, "input.txt")
+
+PRIO = {letter: i for i, letter in enumerate(ascii_letters, 1)}
+
+
+def rucksacks(lines: Iterable[str]) -> tuple[int, int]:
+    # both parts in one pass, set() builds the item sets in C, lines after the last full group are ignored
+    p1, p2 = 0, 0
+    for group in batched(lines, 3):
+        for rucksack in group:
+            l = len(rucksack)//2
+            for item in set(rucksack[:l]).intersection(rucksack[l:]):
+                p1 += PRIO[item]
+        if len(group) == 3:
+            for item in set(group[0]).intersection(group[1], group[2]):
+                p2 += PRIO[item]
+    return (p1, p2)
+
+
+def rucksacks_numpy(data: str | bytes) -> tuple[int, int]:
+    # same sets as item bit masks for the whole input at once: or-reduce the item bits of every half
+    import numpy as np
+
+    buf = byte_array(data)
+    starts, nl = line_bounds(buf)
+    if not len(starts):
+        return (0, 0)
+    halves = starts + (nl - starts)//2
+
+    bit_of = np.zeros(256, dtype=np.uint64)  # byte -> item bit, newline stays 0
+    # 2 has order 66 modulo the prime 67: every bit 1 << i below 64 leaves a different remainder, none leaves 0
+    prio_of_bit = np.zeros(67, dtype=np.int64)  # bit % 67 -> priority, 0 (no item) stays 0
+    for letter, prio in PRIO.items():
+        bit_of[ord(letter)] = 1 << prio
+        prio_of_bit[(1 << prio) % 67] = prio
+    masks = np.bitwise_or.reduceat(bit_of[buf], np.stack((starts, halves), axis=1).ravel())
+    left, right = masks[0::2], masks[1::2]
+    # an empty left half has no items, reduceat would give it the bit of the first right item instead
+    left[halves == starts] = 0
+
+    # exact index of the single set bit by table lookup
+    p1 = prio_of_bit[(left & right) % 67].sum()
+    # like rucksacks, lines after the last full group are ignored
+    groups = (left | right)[:len(left) - len(left) % 3].reshape(-1, 3)
+    p2 = prio_of_bit[(groups[:, 0] & groups[:, 1] & groups[:, 2]) % 67].sum()
+    return (int(p1), int(p2))
+
+
+def solve(data: str) -> tuple[int, int]:
+    return rucksacks(data.splitlines())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", nargs="?", default=input_path, help="input file, - for stdin")
+    parser.add_argument("--numpy", action="store_true", help="read everything and use the vectorized path")
+    args = parser.parse_args()
+
+    if args.numpy:
+        with mapped(args.input) as m:
+            p1, p2 = rucksacks_numpy(m)
+    else:
+        p1, p2 = rucksacks(iter_lines(args.input))
+    print("Part 1:", p1)
+    print("Part 2:", p2)
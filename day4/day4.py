@@ -1,27 +1,105 @@
+import argparse
 import os.path
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+type Interval = tuple[int, int]  # sections [a,b], both included
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
 
-data = open(input_path).read().splitlines()
+
+class SectionIndex:
+    # sorted starts and ends of all assignments:
+    # [a,b] misses [l,r] exactly if r < a or l > b, both are counted with bisect
+    def __init__(self, intervals: Iterable[Interval]) -> None:
+        starts, ends = [], []
+        for l, r in intervals:
+            starts.append(l)
+            ends.append(r)
+        self.starts = sorted(starts)
+        self.ends = sorted(ends)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def overlapping(self, a: int, b: int | None = None) -> int:
+        # assignments sharing at least one section with [a,b], b=None -> single section a
+        if b is None:
+            b = a
+        if a > b:
+            raise ValueError(f"empty range {a}-{b}")
+        return bisect_right(self.starts, b) - bisect_left(self.ends, a)
+
+
+def parse(data: str) -> list[tuple[int, int, int, int]]:
+    pairs = []
+    for line in data.splitlines():
+        i1, i2 = line.split(",", 1)
+        a, b = map(int, i1.split("-", 1))  # interval [a,b]
+        c, d = map(int, i2.split("-", 1))  # interval [c,d]
+        pairs.append((a, b, c, d))
+    return pairs
+
+
+def parse_numpy(data: str) -> "NDArray":
+    # (n,4) array, every row a,b,c,d
+    import numpy as np
+
+    numbers = data.strip().replace("-", ",").replace("\n", ",")
+    return np.fromstring(numbers, sep=",", dtype=np.int64).reshape(-1, 4)
+
+
+def count(pairs: Iterable[tuple[int, int, int, int]]) -> tuple[int, int]:
+    p1, p2 = 0, 0
+    for a, b, c, d in pairs:
+        if a <= d and c <= b:  # overlap
+            p2 += 1
+            if (a <= c and d <= b) or (c <= a and b <= d):  # one contains the other
+                p1 += 1
+    return (p1, p2)
+
+
+def count_numpy(pairs: "NDArray") -> tuple[int, int]:
+    a, b, c, d = pairs.T
+    contains = ((a <= c) & (d <= b)) | ((c <= a) & (b <= d))
+    overlaps = (a <= d) & (c <= b)
+    return (int(contains.sum()), int(overlaps.sum()))
+
+
+def section_index(pairs: Iterable[tuple[int, int, int, int]]) -> SectionIndex:
+    # both elves of every pair are an assignment
+    return SectionIndex(interval for a, b, c, d in pairs for interval in ((a, b), (c, d)))
+
+
+def solve(data: str) -> tuple[int, int]:
+    return count(parse(data))
 
 
-def intersection(x: range, y: range) -> range:
-    return range(max(x.start, y.start), min(x.stop, y.stop))
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--numpy", action="store_true", help="count with numpy")
+    parser.add_argument("--query", nargs=2, type=int, action="append", metavar=("LO", "HI"),
+                        help="number of assignments overlapping sections LO to HI, repeatable")
+    args = parser.parse_args()
 
+    with open(input_path) as f:
+        data = f.read()
 
-p1, p2 = 0, 0
-for line in data:
-    i1, i2 = line.split(",", 1)
-    a, b = map(int, i1.split("-", 1))  # interval [a,b]
-    c, d = map(int, i2.split("-", 1))  # interval [c,d]
-    x, y = range(a, b+1), range(c, d+1)
-    inter = intersection(x, y)
-    if inter == x or inter == y:
-        p1 += 1
-        p2 += 1
-    elif inter:  # true if not empty
-        p2 += 1
+    if args.numpy:
+        p1, p2 = count_numpy(parse_numpy(data))
+    else:
+        p1, p2 = count(parse(data))
+    print("Part 1:", p1)
+    print("Part 2:", p2)
 
-print("Part 1:", p1)
-print("Part 2:", p2)
+    if args.query:
+        index = section_index(parse(data))
+        for lo, hi in args.query:
+            try:
+                print(f"Overlapping {lo}-{hi}:", index.overlapping(lo, hi))
+            except ValueError as e:
+                parser.error(str(e))
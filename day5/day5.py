@@ -1,33 +1,55 @@
+import argparse
 import os.path
 from collections import defaultdict
-import re
-from copy import deepcopy
+from itertools import takewhile
+from typing import Iterable
+
+from aoc.inputs import iter_lines
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
 
-stacks_str, moves_str = open(input_path).read().split("\n\n")
 
-stacks: dict[int, list[str]] = defaultdict(list)
+def crane(lines: Iterable[str]) -> tuple[str, str]:
+    lines = iter(lines)
+    rows: defaultdict[int, list[str]] = defaultdict(list)
+    width = 0
+
+    for line in takewhile(bool, lines):  # drawing ends with the blank line
+        width = max(width, len(line))
+        for i, c in enumerate(line, 1):
+            if c.isalpha():
+                rows[i//4+1].append(c)  # top to bottom, reversed once below
+
+    # list per stack (empty ones included), top crate last. 9000 and 9001 get their own copy
+    stacks = [rows[i][::-1] for i in range(1, (width+2)//4 + 1)]
+    stacks2 = [stack[:] for stack in stacks]
+
+    for move in lines:  # the rest are moves, one at a time
+        _, amount_str, _, source_str, _, target_str = move.split(" ")
+        amount, source, target = int(amount_str), int(source_str)-1, int(target_str)-1
+
+        # in place: only the moved crates are touched, no matter how tall the stacks are
+        src = stacks[source]
+        stacks[target] += src[:-amount-1:-1]  # 9000: one by one -> reversed
+        del src[-amount:]
+
+        src = stacks2[source]
+        stacks2[target] += src[-amount:]  # 9001: all at once
+        del src[-amount:]
 
-for line in stacks_str.splitlines():
-    for i, c in enumerate(line, 1):
-        if c.isalpha():
-            stacks[i//4+1].insert(0, c)
+    return ("".join(stack[-1] for stack in stacks if stack), "".join(stack[-1] for stack in stacks2 if stack))
 
-stacks = {i: stacks[i] for i in sorted(stacks)}
-stacks2 = deepcopy(stacks)
 
-for move in moves_str.splitlines():
-    amount, source, target = map(int, re.findall(r"\d+", move))
-    rest, to_move = stacks[source][:-amount], stacks[source][-amount:]
-    rest2, to_move2 = stacks2[source][:-amount], stacks2[source][-amount:]
+def solve(data: str) -> tuple[str, str]:
+    return crane(data.splitlines())
 
-    stacks[source] = rest
-    stacks[target] += reversed(to_move)
 
-    stacks2[source] = rest2
-    stacks2[target] += to_move2
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", nargs="?", default=input_path, help="input file, - for stdin")
+    args = parser.parse_args()
 
-print("Part 1:", "".join(stack[-1] for stack in stacks.values()))
-print("Part 2:", "".join(stack[-1] for stack in stacks2.values()))
\ No newline at end of file
+    p1, p2 = crane(iter_lines(args.input))
+    print("Part 1:", p1)
+    print("Part 2:", p2)
@@ -1,17 +1,59 @@
+import argparse
 import os.path
-from more_itertools import sliding_window
+import sys
+from functools import partial
+from typing import BinaryIO, Iterable, Iterator
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
 
-signal = open(input_path).read()
 
-p = []
-for k in [4, 14]:
-    for i, window in enumerate(sliding_window(signal, k)):
-        if len(set(window)) == k:
-            p.append(i+k)
-            break
+def read_chunks(reader: BinaryIO, size: int = 1 << 16) -> Iterator[bytes]:
+    # anything with read(n): files, sys.stdin.buffer, socket.makefile("rb")
+    return iter(partial(reader.read, size), b"")
 
-print("Part 1:", p[0])
-print("Part 2:", p[1])
+
+def find_markers(chunks: Iterable[bytes], lengths: Iterable[int]) -> dict[int, int]:
+    # one pass for all lengths: "start" is where the longest run of distinct
+    # characters ending at i begins, a repeated character moves it behind its last occurrence
+    pending = sorted(set(lengths))
+    found: dict[int, int] = {}
+    last = [-1] * 256
+    start = 0
+    offset = 0
+    for chunk in chunks:
+        for i, c in enumerate(chunk, offset):
+            if last[c] >= start:
+                start = last[c] + 1
+            last[c] = i
+            while pending and i - start + 1 >= pending[0]:
+                found[pending.pop(0)] = i + 1  # characters processed
+            if not pending:  # stop reading, the rest of the signal does not matter
+                return found
+        offset += len(chunk)
+    return found
+
+
+def solve(signal: str) -> tuple[int, int]:
+    markers = find_markers([signal.encode()], (4, 14))
+    return (markers[4], markers[14])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", nargs="?", default=input_path, help="input file, - for stdin")
+    parser.add_argument("-k", nargs="+", type=int, default=[4, 14], help="marker lengths")
+    args = parser.parse_args()
+
+    if args.input == "-":
+        markers = find_markers(read_chunks(sys.stdin.buffer), args.k)
+    else:
+        with open(args.input, "rb") as f:
+            markers = find_markers(read_chunks(f), args.k)
+
+    if args.k == [4, 14]:
+        print("Part 1:", markers[4])
+        print("Part 2:", markers[14])
+    else:
+        for k in args.k:
+            print(f"Marker {k}:", markers.get(k))
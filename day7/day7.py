@@ -1,75 +1,85 @@
+import argparse
 import os.path
-from dataclasses import dataclass, field
-from typing import ClassVar
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable
+
+from aoc.inputs import iter_lines
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
-data = open(input_path).read().splitlines()
-
-
-@dataclass
-class File:
-    name: str
-    size: int
-
-
-@dataclass
-class Folder:
-    folder_sizes: ClassVar[list[int]] = []
-    name: str
-    parent: Folder | None
-    size: int = 0
-    subfolders: dict[str, Folder] = field(default_factory=dict)
-    files: list[File] = field(default_factory=list)
-
-    def add_subfolder(self, name: str) -> None:
-        self.subfolders[name] = Folder(name, self)
-
-    def add_file(self, name: str, size: int) -> None:
-        self.files.append(File(name, size))
-
-    def print_tree(self, depth: int = 0) -> None:
-        print("  "*depth, f"- {self.name} (dir - {self.size})")
-        for folder in self.subfolders.values():
-            folder.print_tree(depth+1)
-        for f in self.files:
-            print("  "*(depth+1), f"+ {f.name} ({f.size})")
-
-    def calc_size(self) -> int:
-        size = 0
-        if self.files:
-            size += sum(f.size for f in self.files)
-        if self.subfolders:
-            size += sum(f.calc_size() for f in self.subfolders.values())
-        self.size = size
-        Folder.folder_sizes.append(size)
-        return size
-
-
-root = Folder("/", None)
-
-# its a tree with files as leafs
-curr = root
-for line in data:
-    if line.startswith("$ ls"):
-        continue
-    elif line.startswith("$ cd"):
-        folder = line[5:]
-        if folder == "/":
-            curr = root
-        elif folder == "..":
-            if curr.parent is not None:
-                curr = curr.parent
-        else:
-            curr = curr.subfolders[folder]
-    elif line.startswith("dir"):
-        folder = line[4:]
-        curr.add_subfolder(folder)
-    else:  # file in current folder
-        size_str, name = line.split(" ", 1)
-        curr.add_file(name, int(size_str))
-
-root_size = root.calc_size()
-# root.print_tree()
-print("Part 1:", sum(s for s in Folder.folder_sizes if s <= 100_000))
-print("Part 2:", min(s for s in Folder.folder_sizes if 70_000_000 - root_size + s >= 30_000_000))
+
+DISK = 70_000_000
+NEEDED = 30_000_000
+SMALL = 100_000
+
+
+def parse(lines: Iterable[str]) -> tuple[array, array]:
+    # flat tree: folders are numbered in the order they are seen, root is 0
+    # a folder is always seen after its parent, so parent[i] < i
+    parent = array("q", [-1])
+    size = array("q", [0])  # own files only, aggregate() adds the subfolders
+    children: dict[tuple[int, str], int] = {}  # (folder, name) -> subfolder
+
+    def subfolder(folder: int, name: str) -> int:
+        key = (folder, name)
+        sub = children.get(key)
+        if sub is None:
+            sub = children[key] = len(parent)
+            parent.append(folder)
+            size.append(0)
+        return sub
+
+    curr = 0
+    for line in lines:
+        if not line:
+            continue
+        first = line[0]
+        if first == "$":
+            if line[2] == "c":  # "$ ls" needs nothing
+                folder = line[5:]
+                if folder == "/":
+                    curr = 0
+                elif folder == "..":
+                    if curr:
+                        curr = parent[curr]
+                else:
+                    curr = subfolder(curr, folder)
+        elif first == "d":
+            subfolder(curr, line[4:])
+        else:  # file in current folder
+            size[curr] += int(line.partition(" ")[0])
+    return parent, size
+
+
+def aggregate(parent: array, size: array) -> None:
+    # children have larger indices than their parent: going backwards
+    # every folder is complete before it is added to its parent, no recursion
+    for i in range(len(parent)-1, 0, -1):
+        size[parent[i]] += size[i]
+
+
+def solve_sizes(size: array) -> tuple[int, int]:
+    sizes = sorted(size)
+    p1 = sum(sizes[:bisect_right(sizes, SMALL)])
+    # smallest folder that frees enough space, root always does
+    p2 = sizes[bisect_left(sizes, NEEDED - (DISK - size[0]))]
+    return (p1, p2)
+
+
+def solve(data: str) -> tuple[int, int]:
+    parent, size = parse(data.splitlines())
+    aggregate(parent, size)
+    return solve_sizes(size)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", nargs="?", default=input_path, help="input file, - for stdin")
+    args = parser.parse_args()
+
+    parent, size = parse(iter_lines(args.input))
+    aggregate(parent, size)
+    p1, p2 = solve_sizes(size)
+    print("Part 1:", p1)
+    print("Part 2:", p2)
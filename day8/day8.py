@@ -1,50 +1,52 @@
 import os.path
-from math import prod
+
+import numpy as np
+from numpy.typing import NDArray
+
+from aoc.inputs import byte_array
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
-data = open(input_path).read().splitlines()
-
-grid = {i + j*1j: int(c) for j, row in enumerate(data) for i, c in enumerate(row)}
-dimy, dimx = len(data), len(data[0])
-
-
-def is_visible(pos: complex) -> bool:
-    if (
-        pos.real == 0 or pos.real == dimx-1
-        or pos.imag == 0 or pos.imag == dimy-1
-    ):
-        return True
-
-    height = grid[pos]
-    for d in (1, -1, 1j, -1j):
-        visible_from_direction = True
-        new_pos = pos + d
-        while (new_pos in grid):
-            if grid[new_pos] >= height:
-                visible_from_direction = False
-                break
-            new_pos += d
-        if visible_from_direction:
-            return True
-
-    return False
-
-
-def scenic_score(pos: complex) -> int:
-    height = grid[pos]
-    viewing_distances = []
-    for d in (1, -1, 1j, -1j):
-        s = 0
-        new_pos = pos + d
-        while (new_pos in grid):
-            s += 1
-            if grid[new_pos] >= height:
-                break
-            new_pos += d
-        viewing_distances.append(s)
-    return prod(viewing_distances)
-
-
-print("Part 1:", sum(is_visible(pos) for pos in grid))
-print("Part 2:", max(scenic_score(pos) for pos in grid))
+
+
+def parse(data: str | bytes) -> NDArray[np.uint8]:
+    buf = byte_array(data)
+    width = int(np.argmax(buf == ord("\n")))
+    return buf.reshape(-1, width+1)[:, :-1] - np.uint8(ord("0"))
+
+
+def look_up(grid: NDArray[np.uint8], visible: NDArray[np.bool_], score: NDArray[np.int64]) -> None:
+    # sweep the rows top to bottom, one monotonic stack per column
+    # heights are 0-9, so a stack only ever needs its top per height:
+    # blocker[h, c] is the row of the nearest tree above at least h high, -1 if there is none
+    blocker = np.full((10, grid.shape[1]), -1, dtype=np.int32)
+    heights = np.arange(10, dtype=np.uint8)[:, None]
+    cols = np.arange(grid.shape[1])
+    for i, row in enumerate(grid):
+        nearest = blocker[row, cols]
+        visible[i] |= nearest == -1
+        score[i] *= i - np.maximum(nearest, 0)  # the edge stops the view too
+        np.putmask(blocker, heights <= row, i)
+
+
+def survey(grid: NDArray[np.uint8]) -> tuple[NDArray[np.bool_], NDArray[np.int64]]:
+    # every direction is "up" on a flipped or transposed view, results are written through the same view
+    visible = np.zeros(grid.shape, dtype=np.bool_)
+    score = np.ones(grid.shape, dtype=np.int64)
+    columns = np.ascontiguousarray(grid.T)  # rows of the sweep stay contiguous
+    look_up(grid, visible, score)
+    look_up(grid[::-1], visible[::-1], score[::-1])
+    look_up(columns, visible.T, score.T)
+    look_up(columns[::-1], visible.T[::-1], score.T[::-1])
+    return visible, score
+
+
+def solve(data: str) -> tuple[int, int]:
+    visible, score = survey(parse(data))
+    return (int(visible.sum()), int(score.max()))
+
+
+if __name__ == "__main__":
+    p1, p2 = solve(open(input_path).read())
+    print("Part 1:", p1)
+    print("Part 2:", p2)
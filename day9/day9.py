@@ -1,35 +1,114 @@
+import argparse
 import os.path
+from collections import deque
+from typing import Iterable, Iterator
+
+from aoc.inputs import iter_lines
+
+type Run = tuple[int, int, int]  # dx, dy, number of unit moves
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 input_path = os.path.join(dir_path, "input.txt")
-data = open(input_path).read().splitlines()
 
-DIRS: dict[str, complex] = {"R": 1, "L": -1, "U": 1j, "D": -1j}
+DIRS: dict[str, tuple[int, int]] = {"R": (1, 0), "L": (-1, 0), "U": (0, 1), "D": (0, -1)}
+SPAN = (1 << 32) + 1  # |y| < 2**31, odd: multiples of 2**32 would all share their low hash bits
+
+
+def key(x: int, y: int) -> int:
+    # one int per cell for the visited set, linear: key(x+a, y+b) == key(x, y) + key(a, b)
+    return x*SPAN + y
+
+
+def merge_runs(runs: Iterable[Run]) -> Iterator[Run]:
+    # consecutive runs in the same direction become one, empty runs vanish
+    cx, cy, cn = 0, 0, 0
+    for dx, dy, n in runs:
+        if (dx, dy) == (cx, cy):
+            cn += n
+        elif n:
+            if cn:
+                yield cx, cy, cn
+            cx, cy, cn = dx, dy, n
+    if cn:
+        yield cx, cy, cn
 
 
-def count_visited(data: list[str], num_tails: int = 1) -> int:
-    head = 0
-    tails = [0]*num_tails
-    seen = set()
+def head_runs(data: Iterable[str]) -> Iterator[Run]:
+    # lazy, one motion at a time
     for motion in data:
         d_str, steps_str = motion.split(" ", 1)
-        d = DIRS[d_str]
-        for i in range(int(steps_str)):
-            head += d
-            curr = head
-            for k in range(num_tails):
-                tail = tails[k]
-                diff = curr-tail
-                if abs(diff) > 1.5:  # diag would be sqrt(2)
-                    if int(diff.real):
-                        tail += diff.real/abs(diff.real)
-                    if int(diff.imag):
-                        tail += diff.imag/abs(diff.imag) * 1j
-                tails[k] = tail
-                curr = tail
-            seen.add(curr)
-    return len(seen)
-
-
-print("Part 1:", count_visited(data))
-print("Part 2:", count_visited(data, 9))
+        yield *DIRS[d_str], int(steps_str)
+
+
+def _follow(runs: Iterable[Run]) -> Iterator[Run]:
+    off_x, off_y = 0, 0  # knot in front - this knot
+    for dx, dy, n in runs:
+        while n:
+            n -= 1
+            off_x += dx
+            off_y += dy
+            if -1 <= off_x <= 1 and -1 <= off_y <= 1:
+                continue  # still touching
+            move_x, move_y = (off_x > 0) - (off_x < 0), (off_y > 0) - (off_y < 0)
+            off_x -= move_x
+            off_y -= move_y
+            if (move_x, move_y) == (dx, dy):
+                # offset is back to where it was: every remaining step of the run is copied
+                yield dx, dy, n+1
+                n = 0
+            else:
+                yield move_x, move_y, 1
+
+
+def follow(runs: Iterable[Run]) -> Iterator[Run]:
+    # path of the knot behind, it only depends on the path of the knot in front
+    return merge_runs(_follow(runs))
+
+
+def visit(path: Iterable[Run], seen: set[int]) -> Iterator[Run]:
+    # passes the path on and adds every cell on it to seen
+    pos = key(0, 0)
+    seen.add(pos)
+    for dx, dy, n in path:
+        stride = key(dx, dy)
+        seen.update(range(pos + stride, pos + (n+1)*stride, stride))
+        pos += n*stride
+        yield dx, dy, n
+
+
+def visit_counts(path: Iterable[Run], knots: Iterable[int]) -> list[int]:
+    '''
+    number of cells visited by each of the knots, 0 is the head
+    knot by knot over run-length encoded paths, a whole run costs O(1) once the knot has caught up.
+    every knot is a generator over the path of the one in front, so all of them advance
+    together in one pass over the head path, nothing but the visited sets is kept
+    '''
+    knots = list(knots)
+    seen: dict[int, set[int]] = {knot: set() for knot in knots}
+    path = merge_runs(path)
+    for knot in range(max(knots, default=0) + 1):
+        if knot:
+            path = follow(path)
+        if knot in seen:
+            path = visit(path, seen[knot])
+    deque(path, maxlen=0)
+    return [len(seen[knot]) for knot in knots]
+
+
+def count_visited(path: Iterable[Run], num_tails: int = 1) -> int:
+    return visit_counts(path, [num_tails])[0]
+
+
+def solve(data: str) -> tuple[int, int]:
+    p1, p2 = visit_counts(head_runs(data.splitlines()), (1, 9))
+    return (p1, p2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", nargs="?", default=input_path, help="input file, - for stdin")
+    args = parser.parse_args()
+
+    p1, p2 = visit_counts(head_runs(iter_lines(args.input)), (1, 9))
+    print("Part 1:", p1)
+    print("Part 2:", p2)